@@ -2,28 +2,50 @@
 
 __version__ = "0.2.0"
 
-from .record import Record, parse_record, parse_jsonl
-from .schema import (
-    SchemaEntry,
-    CollectionSchema,
-    discover_schema,
-    load_schema_yaml,
-    save_schema_yaml,
-)
-from .readme import Readme, parse_readme, save_readme
-from .database import Database
-
-__all__ = [
-    "Record",
-    "parse_record",
-    "parse_jsonl",
-    "SchemaEntry",
-    "CollectionSchema",
-    "discover_schema",
-    "load_schema_yaml",
-    "save_schema_yaml",
-    "Readme",
-    "parse_readme",
-    "save_readme",
-    "Database",
-]
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .record import Record, parse_record, parse_jsonl  # noqa: F401
+    from .schema import (  # noqa: F401
+        SchemaEntry,
+        CollectionSchema,
+        discover_schema,
+        load_schema_yaml,
+        save_schema_yaml,
+    )
+    from .readme import Readme, parse_readme, save_readme  # noqa: F401
+    from .database import Database  # noqa: F401
+
+# Public names are resolved on first access (PEP 562), so that
+# ``arkiv --version`` and other light CLI paths don't pay for importing
+# yaml and sqlite3.
+_EXPORTS = {
+    "Record": ".record",
+    "parse_record": ".record",
+    "parse_jsonl": ".record",
+    "SchemaEntry": ".schema",
+    "CollectionSchema": ".schema",
+    "discover_schema": ".schema",
+    "load_schema_yaml": ".schema",
+    "save_schema_yaml": ".schema",
+    "Readme": ".readme",
+    "parse_readme": ".readme",
+    "save_readme": ".readme",
+    "Database": ".database",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
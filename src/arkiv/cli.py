@@ -16,6 +16,24 @@ def _is_db_path(path: Path) -> bool:
     return path.suffix.lower() in _DB_EXTENSIONS
 
 
+def _print_json(obj, default=None):
+    """Print *obj* to stdout as indented JSON.
+
+    Written as UTF-8 bytes when stdout has a binary buffer, so non-ASCII
+    text survives consoles whose encoding can't represent it.
+    """
+    from . import jsonio
+
+    data = jsonio.dumps_indented(obj, default=default) + "\n"
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(data)
+        return
+    sys.stdout.flush()
+    buffer.write(data.encode("utf-8"))
+    buffer.flush()
+
+
 def cmd_convert(args):
     """Convert between the two arkiv archive forms.
 
@@ -52,20 +70,14 @@ def cmd_convert(args):
 
         if is_bundle(output):
             with tempfile.TemporaryDirectory(prefix="arkiv-convert-") as tmp:
-                db = Database(input_path, read_only=True)
-                try:
+                with Database(input_path, read_only=True) as db:
                     db.export(tmp, nested=nested, since=since, until=until)
-                finally:
-                    db.close()
                 pack_bundle(Path(tmp), output)
             print(f"Converted {input_path.name} → {output}")
             return
 
-        db = Database(input_path, read_only=True)
-        try:
+        with Database(input_path, read_only=True) as db:
             db.export(output, nested=nested, since=since, until=until)
-        finally:
-            db.close()
         print(f"Converted {input_path.name} → {output}")
         return
 
@@ -98,8 +110,7 @@ def cmd_convert(args):
     if is_bundle(input_path):
         with tempfile.TemporaryDirectory(prefix="arkiv-unpack-") as tmp:
             unpack_bundle(input_path, Path(tmp))
-            db = Database(output)
-            try:
+            with Database(output) as db:
                 readme = Path(tmp) / "README.md"
                 if readme.exists():
                     count = db.import_readme(readme)
@@ -108,16 +119,13 @@ def cmd_convert(args):
                         db.import_jsonl(j)
                         for j in sorted(Path(tmp).glob("*.jsonl"))
                     )
-            finally:
-                db.close()
         print(f"Converted {input_path.name} → {output} ({count} records)")
         return
 
     # Directory input
     if input_path.is_dir():
         readme = input_path / "README.md"
-        db = Database(output)
-        try:
+        with Database(output) as db:
             if readme.exists():
                 count = db.import_readme(readme)
             else:
@@ -130,27 +138,19 @@ def cmd_convert(args):
                         f"Directory has no README.md and no .jsonl files: "
                         f"{input_path}"
                     )
-        finally:
-            db.close()
         print(f"Converted {input_path} → {output} ({count} records)")
         return
 
     # Single file: README.md or JSONL
     if input_path.suffix == ".md":
-        db = Database(output)
-        try:
+        with Database(output) as db:
             count = db.import_readme(input_path)
-        finally:
-            db.close()
         print(f"Converted {input_path.name} → {output} ({count} records)")
         return
 
     # Treat as JSONL
-    db = Database(output)
-    try:
+    with Database(output) as db:
         count = db.import_jsonl(input_path)
-    finally:
-        db.close()
     print(f"Converted {input_path.name} → {output} ({count} records)")
 
 
@@ -162,16 +162,15 @@ def cmd_schema(args):
     if input_path.suffix == ".db":
         from .database import Database
 
-        db = Database(input_path, read_only=True)
-        output = db.get_schema()
-        db.close()
+        with Database(input_path, read_only=True) as db:
+            output = db.get_schema()
     else:
         from .schema import discover_schema
 
         schema = discover_schema(input_path)
         output = {key: entry.to_dict() for key, entry in schema.items()}
 
-    print(json.dumps(output, indent=2))
+    _print_json(output)
 
 
 def _resolve_db(path_str, writable=False):
@@ -231,10 +230,9 @@ def _resolve_db(path_str, writable=False):
 
 def cmd_query(args):
     """Run a SQL query against the database."""
-    db = _resolve_db(args.db)
-    results = db.query(args.sql)
-    db.close()
-    print(json.dumps(results, indent=2, default=str))
+    with _resolve_db(args.db) as db:
+        results = db.query(args.sql)
+    _print_json(results, default=str)
 
 
 def cmd_info(args):
@@ -244,28 +242,28 @@ def cmd_info(args):
     if input_path.suffix == ".db":
         from .database import Database
 
-        db = Database(input_path, read_only=True)
-        info = db.get_info()
-        db.close()
+        with Database(input_path, read_only=True) as db:
+            info = db.get_info()
     else:
-        from .record import parse_jsonl
-        from .schema import discover_schema
+        from .schema import discover_collection_schema
 
         collection = input_path.stem
-        records = list(parse_jsonl(input_path))
-        schema = discover_schema(input_path)
-        metadata_keys = {key: entry.to_dict() for key, entry in schema.items()}
+        coll_schema = discover_collection_schema(input_path)
+        record_count = coll_schema.record_count
+        metadata_keys = {
+            key: entry.to_dict() for key, entry in coll_schema.metadata_keys.items()
+        }
 
-        coll_info = {"record_count": len(records)}
+        coll_info = {"record_count": record_count}
         if metadata_keys:
             coll_info["metadata_keys"] = metadata_keys
 
         info = {
-            "total_records": len(records),
+            "total_records": record_count,
             "collections": {collection: coll_info},
         }
 
-    print(json.dumps(info, indent=2))
+    _print_json(info)
 
 
 def _require_jsonl(path, suggestion):
@@ -280,17 +278,37 @@ def _require_jsonl(path, suggestion):
         sys.exit(1)
 
 
-def cmd_detect(args):
-    """Check if a JSONL file is valid arkiv format."""
-    from .record import KNOWN_FIELDS
+# Common misspellings of the standard fields. `detect` suggests all of
+# them; `fix` only rewrites the unambiguous URI aliases.
+_FIELD_SUGGESTIONS = {
+    "url": "uri", "link": "uri", "href": "uri",
+    "type": "mimetype", "mime": "mimetype",
+}
+_FIX_MAP = {"url": "uri", "link": "uri", "href": "uri"}
+# A line can only need fixing if one of the keys appears in it verbatim,
+# or spelled with \u escapes. Lines with neither are passed through by
+# `fix` without being parsed; false positives just get parsed as usual.
+_FIX_NEEDLES = tuple(f'"{key}"'.encode() for key in _FIX_MAP) + (b"\\u",)
+
+
+# Files at least this large are scanned by `detect` in parallel, one
+# newline-aligned byte range per CPU. Below it, process start-up costs
+# more than it saves.
+_PARALLEL_DETECT_MIN_BYTES = 10 * 1024 * 1024
 
-    input_path = Path(args.input)
-    _require_jsonl(input_path, "info")
-    field_suggestions = {
-        "url": "uri", "link": "uri", "href": "uri",
-        "type": "mimetype", "mime": "mimetype",
-    }
 
+def _detect_chunk(path, start, end):
+    """Scan the lines of *path* that begin in the byte range [start, end).
+
+    Returns ``(lines, total, errors, fields_used, unknown_fields,
+    metadata_keys, warnings)`` where ``lines`` counts every line seen
+    (blank ones included) and each warning is a ``(lineno, message)``
+    pair numbered from 1 within the chunk.
+    """
+    from . import jsonio
+    from .record import KNOWN_FIELDS
+
+    lines = 0
     total = 0
     errors = 0
     fields_used = set()
@@ -298,33 +316,97 @@ def cmd_detect(args):
     metadata_keys = set()
     warnings = []
 
-    with open(input_path, encoding="utf-8") as f:
-        for lineno, line in enumerate(f, 1):
+    # Binary mode: lines go to the decoder as raw UTF-8 bytes, skipping a
+    # decode step when orjson is available.
+    with open(path, "rb") as f:
+        pos = start
+        if start > 0:
+            # The line straddling `start` belongs to the previous chunk.
+            f.seek(start - 1)
+            pos = start - 1 + len(f.readline())
+        while pos < end:
+            line = f.readline()
+            if not line:
+                break
+            pos += len(line)
+            lines += 1
             line = line.strip()
             if not line:
                 continue
             try:
-                obj = json.loads(line)
+                obj = jsonio.loads(line)
             except json.JSONDecodeError:
-                warnings.append(f"Line {lineno}: invalid JSON")
+                warnings.append((lines, "invalid JSON"))
                 errors += 1
                 continue
             if not isinstance(obj, dict):
-                warnings.append(f"Line {lineno}: not a JSON object")
+                warnings.append((lines, "not a JSON object"))
                 errors += 1
                 continue
 
             total += 1
-            for key in obj:
-                if key in KNOWN_FIELDS:
-                    fields_used.add(key)
-                else:
-                    unknown_fields.add(key)
-            if isinstance(obj.get("metadata"), dict):
-                metadata_keys.update(obj["metadata"].keys())
+            keys = obj.keys()
+            fields_used |= keys & KNOWN_FIELDS
+            unknown_fields |= keys - KNOWN_FIELDS
+            metadata = obj.get("metadata")
+            if isinstance(metadata, dict):
+                metadata_keys |= metadata.keys()
+
+    return lines, total, errors, fields_used, unknown_fields, metadata_keys, warnings
+
+
+def _scan_detect(path):
+    """Run `_detect_chunk` over the whole file, in parallel if it is large.
+
+    Returns ``(total, errors, fields_used, unknown_fields, metadata_keys,
+    warnings)`` with warnings rendered and numbered by file line.
+    """
+    import os
+
+    size = os.path.getsize(path)
+    workers = os.cpu_count() or 1
+    if size < _PARALLEL_DETECT_MIN_BYTES or workers < 2:
+        chunks = [_detect_chunk(path, 0, size)]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        step = -(-size // workers)
+        starts = list(range(0, size, step))
+        ends = [min(s + step, size) for s in starts]
+        with ProcessPoolExecutor(max_workers=len(starts)) as pool:
+            chunks = list(pool.map(
+                _detect_chunk, [path] * len(starts), starts, ends
+            ))
+
+    total = 0
+    errors = 0
+    fields_used = set()
+    unknown_fields = set()
+    metadata_keys = set()
+    warnings = []
+    offset = 0
+    for lines, c_total, c_errors, c_fields, c_unknown, c_meta, c_warn in chunks:
+        total += c_total
+        errors += c_errors
+        fields_used |= c_fields
+        unknown_fields |= c_unknown
+        metadata_keys |= c_meta
+        warnings.extend(f"Line {offset + n}: {msg}" for n, msg in c_warn)
+        offset += lines
+    return total, errors, fields_used, unknown_fields, metadata_keys, warnings
+
+
+def cmd_detect(args):
+    """Check if a JSONL file is valid arkiv format."""
+    input_path = Path(args.input)
+    _require_jsonl(input_path, "info")
+
+    total, errors, fields_used, unknown_fields, metadata_keys, warnings = (
+        _scan_detect(input_path)
+    )
 
     for field in sorted(unknown_fields):
-        suggestion = field_suggestions.get(field)
+        suggestion = _FIELD_SUGGESTIONS.get(field)
         if suggestion:
             warnings.append(
                 f"Unknown field '{field}' — did you mean '{suggestion}'?"
@@ -387,50 +469,74 @@ def cmd_detect(args):
     }
     if schema_checks:
         result["schema_info"] = schema_checks
-    print(json.dumps(result, indent=2))
+    _print_json(result)
 
     if args.strict and warnings:
         sys.exit(1)
 
 
 def cmd_fix(args):
-    """Fix known field misspellings in a JSONL file."""
+    """Fix known field misspellings in a JSONL file.
+
+    Streams the input into a temporary sibling file and atomically
+    replaces the original, so memory use is independent of file size.
+    Symlinks are followed, so the file they point to is the one
+    replaced; other hard links to it keep the old contents.
+    """
+    import os
+    import shutil
+    import tempfile
+
+    from . import jsonio
+
     input_path = Path(args.input)
     _require_jsonl(input_path, "info")
-    fix_map = {"url": "uri", "link": "uri", "href": "uri"}
 
-    lines = input_path.read_text(encoding="utf-8").splitlines(keepends=True)
+    # Replace the symlink's target, not the link itself.
+    target_path = input_path.resolve()
+
     fixed_count = 0
-    out_lines = []
-
-    for line in lines:
-        stripped = line.strip()
-        if not stripped:
-            out_lines.append(line)
-            continue
-        try:
-            obj = json.loads(stripped)
-        except json.JSONDecodeError:
-            out_lines.append(line)
-            continue
-        if not isinstance(obj, dict):
-            out_lines.append(line)
-            continue
-
-        changed = False
-        for unknown_field, target_field in fix_map.items():
-            if unknown_field in obj and target_field not in obj:
-                obj[target_field] = obj[unknown_field]
-                changed = True
-                fixed_count += 1
-
-        if changed:
-            out_lines.append(json.dumps(obj, ensure_ascii=False) + "\n")
-        else:
-            out_lines.append(line)
+    fd, tmp_name = tempfile.mkstemp(
+        prefix=f".{target_path.name}.", suffix=".tmp", dir=target_path.parent
+    )
+    try:
+        with open(target_path, "rb") as fin, os.fdopen(fd, "wb") as fout:
+            for line in fin:
+                stripped = line.strip()
+                # Only objects can be fixed; anything else (blank lines,
+                # arrays, junk) is copied through without being decoded.
+                if not stripped.startswith(b"{") or not any(
+                    n in line for n in _FIX_NEEDLES
+                ):
+                    fout.write(line)
+                    continue
+                try:
+                    obj = jsonio.loads(stripped)
+                except json.JSONDecodeError:
+                    fout.write(line)
+                    continue
+                if not isinstance(obj, dict) or not (obj.keys() & _FIX_MAP.keys()):
+                    fout.write(line)
+                    continue
+
+                changed = False
+                for unknown_field, target_field in _FIX_MAP.items():
+                    if unknown_field in obj and target_field not in obj:
+                        obj[target_field] = obj[unknown_field]
+                        changed = True
+                        fixed_count += 1
+
+                if changed:
+                    fout.write(jsonio.dumps_bytes(obj) + b"\n")
+                else:
+                    fout.write(line)
+        shutil.copymode(target_path, tmp_name)
+        os.replace(tmp_name, target_path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
 
-    input_path.write_text("".join(out_lines), encoding="utf-8")
-    print(json.dumps({"fixed": fixed_count, "file": str(input_path)}, indent=2))
+    _print_json({"fixed": fixed_count, "file": str(input_path)})
 
 
 def cmd_mcp(args):
@@ -438,23 +544,11 @@ def cmd_mcp(args):
     from .server import run_mcp_server
 
     writable = getattr(args, 'writable', False)
-    db = _resolve_db(args.db, writable=writable)
-    run_mcp_server(db_path=str(db.path), writable=writable)
-    db.close()
-
-
-def main():
-    parser = argparse.ArgumentParser(
-        prog="arkiv",
-        description="Universal personal data format. JSONL in, SQL out, MCP to LLMs.",
-    )
-    parser.add_argument(
-        "--version", action="version", version=f"arkiv {__version__}"
-    )
+    with _resolve_db(args.db, writable=writable) as db:
+        run_mcp_server(db_path=str(db.path), writable=writable, db=db)
 
-    subparsers = parser.add_subparsers(dest="command")
 
-    # convert
+def _add_convert_parser(subparsers):
     p_convert = subparsers.add_parser(
         "convert",
         help=(
@@ -493,27 +587,31 @@ def main():
     )
     p_convert.set_defaults(func=cmd_convert)
 
-    # schema
+
+def _add_schema_parser(subparsers):
     p_schema = subparsers.add_parser(
         "schema", help="Show schema from JSONL file or database"
     )
     p_schema.add_argument("input", help="JSONL file or SQLite database")
     p_schema.set_defaults(func=cmd_schema)
 
-    # query
+
+def _add_query_parser(subparsers):
     p_query = subparsers.add_parser("query", help="Run SQL query")
     p_query.add_argument("db", help="SQLite database path")
     p_query.add_argument("sql", help="SQL query")
     p_query.set_defaults(func=cmd_query)
 
-    # info
+
+def _add_info_parser(subparsers):
     p_info = subparsers.add_parser(
         "info", help="Show info about JSONL file or database"
     )
     p_info.add_argument("input", help="JSONL file or SQLite database")
     p_info.set_defaults(func=cmd_info)
 
-    # detect
+
+def _add_detect_parser(subparsers):
     p_detect = subparsers.add_parser(
         "detect", help="Check if a JSONL file is valid arkiv format"
     )
@@ -523,28 +621,75 @@ def main():
     )
     p_detect.set_defaults(func=cmd_detect)
 
-    # fix
+
+def _add_fix_parser(subparsers):
     p_fix = subparsers.add_parser(
         "fix", help="Fix known field misspellings in JSONL (e.g. url -> uri)"
     )
     p_fix.add_argument("input", help="JSONL file to fix")
     p_fix.set_defaults(func=cmd_fix)
 
-    # mcp
+
+def _add_mcp_parser(subparsers):
     p_mcp = subparsers.add_parser("mcp", help="Start MCP server")
     p_mcp.add_argument("db", help="SQLite database path")
     p_mcp.add_argument("--writable", action="store_true",
                         help="Enable write_record tool (default: read-only)")
     p_mcp.set_defaults(func=cmd_mcp)
 
-    args = parser.parse_args()
+
+# Subcommand name → function registering its parser, in --help order.
+_SUBCOMMANDS = {
+    "convert": _add_convert_parser,
+    "schema": _add_schema_parser,
+    "query": _add_query_parser,
+    "info": _add_info_parser,
+    "detect": _add_detect_parser,
+    "fix": _add_fix_parser,
+    "mcp": _add_mcp_parser,
+}
+
+
+def _build_parser(command=None):
+    """Build the argument parser.
+
+    When *command* names a subcommand, only that subparser is registered;
+    the others are never consulted. Otherwise (``--help``, ``--version``,
+    typos) all of them are.
+    """
+    parser = argparse.ArgumentParser(
+        prog="arkiv",
+        description="Universal personal data format. JSONL in, SQL out, MCP to LLMs.",
+    )
+    parser.add_argument(
+        "--version", action="version", version=f"arkiv {__version__}"
+    )
+
+    # An explicit metavar keeps usage lines listing every subcommand
+    # even when only one is registered.
+    subparsers = parser.add_subparsers(
+        dest="command", metavar="{" + ",".join(_SUBCOMMANDS) + "}"
+    )
+    if command in _SUBCOMMANDS:
+        _SUBCOMMANDS[command](subparsers)
+    else:
+        for add_parser in _SUBCOMMANDS.values():
+            add_parser(subparsers)
+    return parser
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = _build_parser(argv[0] if argv else None)
+    args = parser.parse_args(argv)
     if not args.command:
         parser.print_help()
         sys.exit(1)
 
     try:
         args.func(args)
-    except (FileNotFoundError, ValueError) as e:
+    except (OSError, ValueError) as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
     except UnicodeDecodeError:
@@ -1,17 +1,18 @@
 """SQLite database for arkiv records."""
 
-import json
+import copy
+import re
 import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Union
 
-import yaml
-
-from .record import Record, parse_jsonl
+from . import jsonio, yamlio
+from .record import parse_jsonl
 from .schema import (
+    SchemaAccumulator,
     SchemaEntry,
     CollectionSchema,
-    discover_schema,
     discover_schema_from_metadata,
     merge_schema,
 )
@@ -43,6 +44,55 @@ def _validate_collection_name(name):
         raise ValueError(f"Collection name is OS-reserved: {name!r}")
 
 
+# Per-connection tuning applied on open. None of these persist in the
+# database file, so archives stay plain single-file rollback-journal
+# databases (no -wal/-shm side files to ship along).
+_CONNECTION_PRAGMAS = (
+    "PRAGMA cache_size = -65536",  # 64 MiB page cache
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",  # 256 MiB
+)
+
+
+# Cheap first-keyword check for query(); the authorizer is the real guard.
+_READ_QUERY = re.compile(r"\s*(?:SELECT|WITH)\b", re.IGNORECASE)
+
+# Authorizer actions a read-only query may perform. SQLite calls the
+# authorizer once per table, column and function a statement touches.
+_READ_ACTIONS = frozenset(
+    {sqlite3.SQLITE_SELECT, sqlite3.SQLITE_READ, sqlite3.SQLITE_FUNCTION}
+)
+
+_RECORD_INDEXES = (
+    ("idx_records_collection", "collection"),
+    ("idx_records_mimetype", "mimetype"),
+    ("idx_records_timestamp", "timestamp"),
+)
+
+_EXPORT_BATCH_SIZE = 1000
+_QUERY_BATCH_SIZE = 1000
+_EXPORT_BUFFER_SIZE = 1 << 20
+_LINE_FIELDS = ("mimetype", "uri", "content", "timestamp")
+
+
+def _row_metadata(row) -> Any:
+    """Decode the metadata column of an export row (None if empty)."""
+    return jsonio.loads(row[4]) if row[4] else None
+
+
+def _record_line(row, metadata: Any) -> bytes:
+    """Render a ``(mimetype, uri, content, timestamp, metadata)`` row as a
+    UTF-8 JSONL line, matching what ``Record.to_json()`` would produce.
+
+    *metadata* is the row's metadata column, already decoded by
+    ``_row_metadata``.
+    """
+    obj = {name: value for name, value in zip(_LINE_FIELDS, row) if value is not None}
+    if metadata is not None:
+        obj["metadata"] = metadata
+    return jsonio.dumps_bytes(obj) + b"\n"
+
+
 class Database:
     """SQLite query layer over arkiv records."""
 
@@ -54,10 +104,59 @@ class Database:
             self.conn = sqlite3.connect(
                 f"file:{self.path}?mode=ro", uri=True
             )
+            self.conn.execute("PRAGMA query_only = 1")
         else:
             self.conn = sqlite3.connect(str(self.path))
+        for pragma in _CONNECTION_PRAGMAS:
+            self.conn.execute(pragma)
+        if not read_only:
             self._ensure_tables()
-        self.conn.row_factory = sqlite3.Row
+        self._transaction_depth = 0
+        self._bulk_loading = False
+        # get_info/get_schema results, valid while state_token() is unchanged.
+        self._read_cache: Dict[Any, Dict[str, Any]] = {}
+        self._read_cache_state: Optional[tuple] = None
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Group writes into a single transaction, committed on success
+        and rolled back on error.
+
+        Nested uses join the outermost transaction, so composite
+        operations like ``import_readme`` commit once for all their
+        collections instead of once per step.
+        """
+        self._transaction_depth += 1
+        try:
+            if self._transaction_depth == 1 and not self.conn.in_transaction:
+                # Explicit BEGIN: sqlite3 only opens transactions implicitly
+                # before DML, and index DDL must be covered too.
+                self.conn.execute("BEGIN")
+            yield
+        except BaseException:
+            if self._transaction_depth == 1:
+                self.conn.rollback()
+            raise
+        else:
+            if self._transaction_depth == 1:
+                self.conn.commit()
+        finally:
+            self._transaction_depth -= 1
+
+    @contextmanager
+    def batch(self) -> Iterator["Database"]:
+        """Run several writes as one transaction::
+
+            with db.batch():
+                for item in items:
+                    db.insert_record("notes", item)
+
+        Everything commits together on exit, or is rolled back if the
+        block raises. Each write otherwise commits on its own, which
+        costs a sync to disk per call.
+        """
+        with self._transaction():
+            yield self
 
     def _ensure_tables(self) -> None:
         self.conn.executescript(
@@ -80,17 +179,46 @@ class Database:
                 sample_values TEXT,
                 description TEXT
             );
+            CREATE INDEX IF NOT EXISTS idx_schema_collection
+                ON _schema(collection, key_path);
 
             CREATE TABLE IF NOT EXISTS _metadata (
                 key TEXT PRIMARY KEY,
                 value TEXT
             );
-
-            CREATE INDEX IF NOT EXISTS idx_records_collection ON records(collection);
-            CREATE INDEX IF NOT EXISTS idx_records_mimetype ON records(mimetype);
-            CREATE INDEX IF NOT EXISTS idx_records_timestamp ON records(timestamp);
         """
         )
+        self._create_record_indexes()
+
+    def _create_record_indexes(self) -> None:
+        for name, column in _RECORD_INDEXES:
+            self.conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {name} ON records({column})"
+            )
+
+    @contextmanager
+    def _bulk_load(self) -> Iterator[None]:
+        """Drop the records indexes while bulk-loading an empty table.
+
+        Building an index once over the loaded rows is much cheaper than
+        updating it on every insert. If the table already holds rows, a
+        rebuild would cover them too, so the indexes are left in place.
+        Must be used inside ``_transaction()``, so that a failed load
+        rolls the index changes back with everything else.
+        """
+        if self._bulk_loading or self.conn.execute(
+            "SELECT 1 FROM records LIMIT 1"
+        ).fetchone():
+            yield
+            return
+        for name, _ in _RECORD_INDEXES:
+            self.conn.execute(f"DROP INDEX IF EXISTS {name}")
+        self._bulk_loading = True
+        try:
+            yield
+        finally:
+            self._bulk_loading = False
+            self._create_record_indexes()
 
     def import_jsonl(
         self, path: Union[str, Path], collection: Optional[str] = None
@@ -105,34 +233,40 @@ class Database:
             collection = path.stem
         _validate_collection_name(collection)
 
-        # Replace semantics: clear existing records for this collection
-        self.conn.execute(
-            "DELETE FROM records WHERE collection = ?", (collection,)
-        )
-
-        count = 0
-        for record in parse_jsonl(path):
+        with self._transaction():
+            # Replace semantics: clear existing records for this collection
             self.conn.execute(
-                "INSERT INTO records (collection, mimetype, uri, content, timestamp, metadata) VALUES (?, ?, ?, ?, ?, ?)",
-                (
-                    collection,
-                    record.mimetype,
-                    record.uri,
-                    record.content,
-                    record.timestamp,
-                    json.dumps(record.metadata) if record.metadata else None,
-                ),
+                "DELETE FROM records WHERE collection = ?", (collection,)
             )
-            count += 1
-        self.conn.commit()
 
-        # Pre-compute schema (preserve existing descriptions)
-        schema = discover_schema(path)
-        existing_desc = self._load_schema_descriptions(collection)
-        for key, entry in schema.items():
-            if key in existing_desc:
-                entry.description = existing_desc[key]
-        self._save_schema_entries(collection, schema)
+            count = 0
+            # Schema is accumulated during the insert pass, so the file is
+            # read only once.
+            acc = SchemaAccumulator()
+
+            def rows():
+                nonlocal count
+                for record in parse_jsonl(path):
+                    count += 1
+                    acc.update(record.metadata)
+                    yield (
+                        collection,
+                        record.mimetype,
+                        record.uri,
+                        record.content,
+                        record.timestamp,
+                        jsonio.dumps(record.metadata) if record.metadata else None,
+                    )
+
+            with self._bulk_load():
+                self.conn.executemany(
+                    "INSERT INTO records (collection, mimetype, uri, content, timestamp, metadata) VALUES (?, ?, ?, ?, ?, ?)",
+                    rows(),
+                )
+
+            # Pre-compute schema (preserve existing descriptions)
+            schema = self._keep_descriptions(collection, acc.finalize())
+            self._save_schema_entries(collection, schema)
 
         return count
 
@@ -162,13 +296,13 @@ class Database:
         if timestamp is None:
             from datetime import datetime, timezone
             timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        metadata_json = json.dumps(metadata) if metadata else None
-        cursor = self.conn.execute(
-            "INSERT INTO records (collection, mimetype, uri, content, timestamp, metadata) "
-            "VALUES (?, ?, ?, ?, ?, ?)",
-            (collection, mimetype, None, content, timestamp, metadata_json),
-        )
-        self.conn.commit()
+        metadata_json = jsonio.dumps(metadata) if metadata else None
+        with self._transaction():
+            cursor = self.conn.execute(
+                "INSERT INTO records (collection, mimetype, uri, content, timestamp, metadata) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (collection, mimetype, None, content, timestamp, metadata_json),
+            )
         return {
             "id": cursor.lastrowid,
             "collection": collection,
@@ -192,13 +326,11 @@ class Database:
             ):
                 if row[0] is None:
                     continue
-                yield json.loads(row[0])
+                yield jsonio.loads(row[0])
 
-        schema = discover_schema_from_metadata(_metadata_iter())
-        existing_desc = self._load_schema_descriptions(collection)
-        for key, entry in schema.items():
-            if key in existing_desc:
-                entry.description = existing_desc[key]
+        schema = self._keep_descriptions(
+            collection, discover_schema_from_metadata(_metadata_iter())
+        )
         self._save_schema_entries(collection, schema)
 
     def _load_schema_descriptions(self, collection: str) -> Dict[str, str]:
@@ -212,67 +344,134 @@ class Database:
         except sqlite3.OperationalError:
             return {}
 
+    def _keep_descriptions(
+        self, collection: str, schema: Dict[str, SchemaEntry]
+    ) -> Dict[str, SchemaEntry]:
+        """Carry stored descriptions over onto a freshly discovered schema."""
+        existing_desc = self._load_schema_descriptions(collection)
+        for key, entry in schema.items():
+            if key in existing_desc:
+                entry.description = existing_desc[key]
+        return schema
+
     def _save_schema_entries(
         self, collection: str, entries: Dict[str, SchemaEntry]
     ) -> None:
         """Replace _schema rows for a collection with the given entries."""
-        self.conn.execute(
-            "DELETE FROM _schema WHERE collection = ?", (collection,)
-        )
-        for key, entry in entries.items():
-            sample = entry.values or ([entry.example] if entry.example else [])
+        with self._transaction():
             self.conn.execute(
-                "INSERT INTO _schema (collection, key_path, type, count, sample_values, description) VALUES (?, ?, ?, ?, ?, ?)",
-                (
+                "DELETE FROM _schema WHERE collection = ?", (collection,)
+            )
+            rows = []
+            for key, entry in entries.items():
+                sample = entry.values or ([entry.example] if entry.example else [])
+                rows.append((
                     collection,
                     key,
                     entry.type,
                     entry.count,
-                    json.dumps(sample) if sample else None,
+                    jsonio.dumps(sample) if sample else None,
                     entry.description,
-                ),
+                ))
+            self.conn.executemany(
+                "INSERT INTO _schema (collection, key_path, type, count, sample_values, description) VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
             )
-        self.conn.commit()
 
     @staticmethod
     def _read_only_authorizer(action, *_args):
         """SQLite authorizer that allows only read operations."""
-        allowed = {
-            sqlite3.SQLITE_SELECT,
-            sqlite3.SQLITE_READ,
-            sqlite3.SQLITE_FUNCTION,
-        }
-        return sqlite3.SQLITE_OK if action in allowed else sqlite3.SQLITE_DENY
+        if action in _READ_ACTIONS:
+            return sqlite3.SQLITE_OK
+        return sqlite3.SQLITE_DENY
 
-    def query(self, sql: str) -> List[Dict[str, Any]]:
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[Dict[str, Any]]:
         """Run a read-only SQL query. Returns list of dicts."""
-        normalized = sql.strip().upper()
-        if not normalized.startswith(("SELECT", "WITH")):
+        return list(self.iter_query(sql, params))
+
+    def iter_query(
+        self, sql: str, params: Sequence[Any] = ()
+    ) -> Iterator[Dict[str, Any]]:
+        """Run a read-only SQL query, yielding one dict per row.
+
+        Rows are fetched in batches, so large results are never held in
+        memory all at once. Validation happens on the first ``next()``.
+        """
+        if not _READ_QUERY.match(sql):
             raise ValueError("Only SELECT queries are allowed")
 
+        # The authorizer is consulted while the statement is compiled,
+        # so it only needs to be installed around execute(); rows can
+        # then be stepped through without it.
         self.conn.set_authorizer(self._read_only_authorizer)
         try:
-            cursor = self.conn.execute(sql)
+            cursor = self.conn.execute(sql, params)
+        except (sqlite3.OperationalError, sqlite3.DatabaseError) as e:
+            raise ValueError(str(e)) from None
+        finally:
+            self.conn.set_authorizer(None)
 
-            if cursor.description is None:
-                raise ValueError("Only SELECT queries are allowed")
+        if cursor.description is None:
+            raise ValueError("Only SELECT queries are allowed")
 
-            columns = [desc[0] for desc in cursor.description]
-            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        columns = [desc[0] for desc in cursor.description]
+        cursor.arraysize = _QUERY_BATCH_SIZE
+        try:
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    return
+                for row in rows:
+                    yield dict(zip(columns, row))
         except (sqlite3.OperationalError, sqlite3.DatabaseError) as e:
             raise ValueError(str(e)) from None
         finally:
-            self.conn.set_authorizer(None)
+            cursor.close()
+
+    def state_token(self) -> tuple:
+        """Return a cheap token that changes whenever the data may have.
+
+        ``PRAGMA data_version`` moves when another connection commits;
+        ``total_changes`` counts rows written through this connection
+        (including by direct ``conn.execute`` calls).
+        """
+        data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        return (data_version, self.conn.total_changes)
+
+    def _cached(
+        self, key: Any, build: Callable[[], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        if self.conn.in_transaction:
+            # state_token() does not move back on rollback, so nothing
+            # read inside an open transaction may outlive it.
+            return build()
+        state = self.state_token()
+        if state != self._read_cache_state:
+            self._read_cache.clear()
+            self._read_cache_state = state
+        value = self._read_cache.get(key)
+        if value is None:
+            value = self._read_cache[key] = build()
+        # Callers get their own copy; mutating it must not leak into
+        # later calls.
+        return copy.deepcopy(value)
 
     def get_info(self) -> Dict[str, Any]:
-        """Get database info: total records, collections, counts."""
-        total = self.conn.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+        """Get database info: total records, collections, counts.
 
+        Like ``get_schema``, the result is cached until the database
+        changes.
+        """
+        return self._cached("info", self._read_info)
+
+    def _read_info(self) -> Dict[str, Any]:
         collections = {}
+        total = 0
         for row in self.conn.execute(
             "SELECT collection, COUNT(*) as cnt FROM records GROUP BY collection"
         ):
             collections[row[0]] = {"record_count": row[1]}
+            total += row[1]
 
         return {"total_records": total, "collections": collections}
 
@@ -281,33 +480,43 @@ class Database:
         return self._load_readme_metadata()
 
     def get_schema(self, collection: Optional[str] = None) -> Dict[str, Any]:
-        """Get pre-computed schema for one or all collections."""
+        """Get pre-computed schema for one or all collections.
+
+        Results are cached until the database changes (see
+        ``state_token``), so repeated calls skip the ``_schema`` scan.
+        Nothing is cached while a transaction is open.
+        """
+        return self._cached(
+            ("schema", collection), lambda: self._read_schema(collection)
+        )
+
+    def _read_schema(self, collection: Optional[str]) -> Dict[str, Any]:
+        sql = "SELECT collection, key_path, type, count, sample_values, description FROM _schema"
+        params: tuple = ()
         if collection:
-            rows = self.conn.execute(
-                "SELECT key_path, type, count, sample_values, description FROM _schema WHERE collection = ?",
-                (collection,),
-            ).fetchall()
-            result = {
-                "collection": collection,
-                "metadata_keys": {},
+            sql += " WHERE collection = ?"
+            params = (collection,)
+
+        # One scan, grouped by collection in order of first appearance.
+        grouped: Dict[str, Dict[str, Any]] = {}
+        for row in self.conn.execute(sql, params):
+            coll = grouped.get(row[0])
+            if coll is None:
+                coll = grouped[row[0]] = {"collection": row[0], "metadata_keys": {}}
+            entry = {
+                "type": row[2],
+                "count": row[3],
+                "values": jsonio.loads(row[4]) if row[4] else [],
             }
-            for row in rows:
-                entry = {
-                    "type": row[1],
-                    "count": row[2],
-                    "values": json.loads(row[3]) if row[3] else [],
-                }
-                if row[4] is not None:
-                    entry["description"] = row[4]
-                result["metadata_keys"][row[0]] = entry
-            return result
-        else:
-            result = {}
-            for row in self.conn.execute(
-                "SELECT DISTINCT collection FROM _schema"
-            ):
-                result[row[0]] = self.get_schema(row[0])
-            return result
+            if row[5] is not None:
+                entry["description"] = row[5]
+            coll["metadata_keys"][row[1]] = entry
+
+        if collection:
+            return grouped.get(
+                collection, {"collection": collection, "metadata_keys": {}}
+            )
+        return grouped
 
     def merge_curated_schema(
         self, collection: str, curated_keys: Dict[str, SchemaEntry]
@@ -324,7 +533,7 @@ class Database:
             existing[row[0]] = SchemaEntry(
                 type=row[1],
                 count=row[2],
-                values=json.loads(row[3]) if row[3] else None,
+                values=jsonio.loads(row[3]) if row[3] else None,
                 description=row[4],
             )
 
@@ -334,19 +543,14 @@ class Database:
     def _store_readme_metadata(self, readme: "Readme") -> None:
         """Store README frontmatter and body in _metadata KV table."""
         upsert = "INSERT OR REPLACE INTO _metadata (key, value) VALUES (?, ?)"
-        if readme.frontmatter:
-            self.conn.execute(
-                upsert,
-                ("readme_frontmatter", yaml.dump(
-                    readme.frontmatter,
-                    default_flow_style=False,
-                    allow_unicode=True,
-                    sort_keys=False,
-                )),
-            )
-        if readme.body:
-            self.conn.execute(upsert, ("readme_body", readme.body))
-        self.conn.commit()
+        with self._transaction():
+            if readme.frontmatter:
+                self.conn.execute(
+                    upsert,
+                    ("readme_frontmatter", yamlio.dump(readme.frontmatter)),
+                )
+            if readme.body:
+                self.conn.execute(upsert, ("readme_body", readme.body))
 
     def _load_readme_metadata(self) -> Optional["Readme"]:
         """Load README data from _metadata table. Returns Readme or None."""
@@ -365,7 +569,7 @@ class Database:
 
         frontmatter = {}
         if "readme_frontmatter" in meta:
-            fm = yaml.safe_load(meta["readme_frontmatter"])
+            fm = yamlio.safe_load(meta["readme_frontmatter"])
             if isinstance(fm, dict):
                 frontmatter = fm
 
@@ -419,6 +623,8 @@ class Database:
                     elif p.endswith("/"):
                         stored_order.append(p[:-1])
 
+        stored_schemas = self.get_schema()
+
         for row in self.conn.execute(
             "SELECT DISTINCT collection FROM records"
         ):
@@ -439,20 +645,29 @@ class Database:
                 params.extend(time_params)
             base_sql += " ORDER BY id"
 
+            # Tuples in batches: no Record objects per record.
+            cursor = self.conn.cursor()
+            cursor.arraysize = _EXPORT_BATCH_SIZE
+            cursor.execute(base_sql, params)
             count = 0
-            with open(jsonl_path, "w", encoding="utf-8") as f:
-                for rec_row in self.conn.execute(base_sql, params):
-                    record = Record(
-                        mimetype=rec_row[0],
-                        uri=rec_row[1],
-                        content=rec_row[2],
-                        timestamp=rec_row[3],
-                        metadata=json.loads(rec_row[4])
-                        if rec_row[4]
-                        else None,
-                    )
-                    f.write(record.to_json() + "\n")
-                    count += 1
+            # A filtered slice needs its own schema; build it from the
+            # rows as they are written rather than re-reading the file.
+            acc = SchemaAccumulator() if since or until else None
+            with open(jsonl_path, "wb", buffering=_EXPORT_BUFFER_SIZE) as f:
+                while True:
+                    rows = cursor.fetchmany()
+                    if not rows:
+                        break
+                    count += len(rows)
+                    if acc is None:
+                        f.writelines(
+                            _record_line(row, _row_metadata(row)) for row in rows
+                        )
+                        continue
+                    for row in rows:
+                        metadata = _row_metadata(row)
+                        f.write(_record_line(row, metadata))
+                        acc.update(metadata)
 
             # Skip empty collections after filtering
             if count == 0:
@@ -465,17 +680,13 @@ class Database:
                 continue
 
             # Build collection schema
-            if since or until:
-                # Two-pass: recompute schema from the filtered JSONL
-                auto_schema = discover_schema(jsonl_path)
-                descs = self._load_schema_descriptions(coll_name)
-                for key, entry in auto_schema.items():
-                    if key in descs:
-                        entry.description = descs[key]
-                metadata_keys_dict = auto_schema
+            if acc is not None:
+                metadata_keys_dict = self._keep_descriptions(
+                    coll_name, acc.finalize()
+                )
             else:
                 # Existing behavior: read from _schema table
-                schema_data = self.get_schema(coll_name)
+                schema_data = stored_schemas.get(coll_name, {})
                 metadata_keys_dict = {
                     key_name: SchemaEntry(
                         type=key_info["type"],
@@ -562,63 +773,71 @@ class Database:
         Returns total records imported.
         """
         from .readme import parse_readme
-        from .schema import load_schema_yaml
 
         readme_path = Path(readme_path)
         readme = parse_readme(readme_path)
         base_dir = readme_path.parent
 
-        # Store README metadata
-        self._store_readme_metadata(readme)
+        with self._transaction(), self._bulk_load():
+            # Store README metadata
+            self._store_readme_metadata(readme)
 
-        total = 0
-        for item in readme.frontmatter.get("contents", []):
-            if not isinstance(item, dict) or "path" not in item:
-                continue
-            entry_path = base_dir / item["path"]
-            if entry_path.is_dir():
-                sub_readme = entry_path / "README.md"
-                if sub_readme.exists():
-                    total += self._import_nested_readme(sub_readme)
-            elif entry_path.suffix == ".jsonl" and entry_path.exists():
-                count = self.import_jsonl(entry_path, collection=entry_path.stem)
-                total += count
-
-        # Merge curated schema if schema.yaml exists
-        schema_yaml_path = base_dir / "schema.yaml"
-        if schema_yaml_path.exists():
-            curated = load_schema_yaml(schema_yaml_path)
-            for coll_name, coll_schema in curated.items():
-                self.merge_curated_schema(coll_name, coll_schema.metadata_keys)
+            total = 0
+            for item in readme.frontmatter.get("contents", []):
+                if not isinstance(item, dict) or "path" not in item:
+                    continue
+                entry_path = base_dir / item["path"]
+                if entry_path.is_dir():
+                    sub_readme = entry_path / "README.md"
+                    if sub_readme.exists():
+                        total += self._import_nested_readme(sub_readme)
+                elif entry_path.suffix == ".jsonl" and entry_path.exists():
+                    count = self.import_jsonl(entry_path, collection=entry_path.stem)
+                    total += count
+
+            # Merge curated schema if schema.yaml exists
+            self._merge_schema_yaml(base_dir / "schema.yaml")
 
         return total
 
     def _import_nested_readme(self, readme_path: Union[str, Path]) -> int:
         """Import contents of a nested README without storing its metadata."""
         from .readme import parse_readme
-        from .schema import load_schema_yaml
 
         readme_path = Path(readme_path)
         sub_readme = parse_readme(readme_path)
         base_dir = readme_path.parent
         total = 0
 
-        for item in sub_readme.frontmatter.get("contents", []):
-            if not isinstance(item, dict) or "path" not in item:
-                continue
-            entry_path = base_dir / item["path"]
-            if entry_path.suffix == ".jsonl" and entry_path.exists():
-                count = self.import_jsonl(entry_path, collection=entry_path.stem)
-                total += count
-
-        # Merge per-collection schema.yaml if present
-        schema_yaml_path = base_dir / "schema.yaml"
-        if schema_yaml_path.exists():
-            curated = load_schema_yaml(schema_yaml_path)
-            for coll_name, coll_schema in curated.items():
-                self.merge_curated_schema(coll_name, coll_schema.metadata_keys)
+        with self._transaction():
+            for item in sub_readme.frontmatter.get("contents", []):
+                if not isinstance(item, dict) or "path" not in item:
+                    continue
+                entry_path = base_dir / item["path"]
+                if entry_path.suffix == ".jsonl" and entry_path.exists():
+                    count = self.import_jsonl(entry_path, collection=entry_path.stem)
+                    total += count
+
+            # Merge per-collection schema.yaml if present
+            self._merge_schema_yaml(base_dir / "schema.yaml")
 
         return total
 
+    def _merge_schema_yaml(self, schema_yaml_path: Path) -> None:
+        """Merge curated schema from a schema.yaml file, if it exists."""
+        from .schema import load_schema_yaml
+
+        if not schema_yaml_path.exists():
+            return
+        curated = load_schema_yaml(schema_yaml_path)
+        for coll_name, coll_schema in curated.items():
+            self.merge_curated_schema(coll_name, coll_schema.metadata_keys)
+
     def close(self) -> None:
         self.conn.close()
+
+    def __enter__(self) -> "Database":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,122 @@
+"""JSON encoding and decoding with an optional orjson fast path.
+
+arkiv parses and writes a lot of small JSON documents: one per JSONL
+line, one per metadata column. When ``orjson`` is installed
+(``pip install arkiv[fast]``) it handles both directions; otherwise the
+stdlib ``json`` module is used.
+
+Both backends decode to the same values, and ``dumps`` writes compact
+JSON (no spaces after separators) with non-ASCII characters left
+unescaped either way. The bytes are not always identical: floats that
+need an exponent are spelled differently (orjson writes ``1e16``, the
+stdlib ``1e+16``), though they read back as the same number. orjson
+would write non-finite floats as ``null``, so documents containing them
+go to the stdlib, which keeps ``NaN``/``Infinity`` as ``json.dumps`` does.
+"""
+
+import json
+import math
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+# Stdlib fallback codecs, built once. ``json.dumps`` with keyword
+# arguments constructs a new JSONEncoder on every call.
+_json_decode = json.JSONDecoder().decode
+_json_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+# orjson decodes integers outside the 64-bit range as floats, silently
+# losing precision. Any run of 19+ digits might be such an integer, so
+# documents containing one go to the stdlib instead. False positives
+# (long digit strings, precise floats) only cost speed. The check maps
+# every digit to "0" and everything else to " " with bytes.translate and
+# looks for a run of 19 zeros: two C-level passes, several times faster
+# than a regex search.
+_DIGIT_MASK = bytes(0x30 if 0x30 <= b <= 0x39 else 0x20 for b in range(256))
+_WIDE_RUN = b"0" * 19
+
+
+def _may_have_wide_int(data: Union[str, bytes]) -> bool:
+    if isinstance(data, str):
+        data = data.encode("utf-8", "surrogatepass")
+    return _WIDE_RUN in data.translate(_DIGIT_MASK)
+
+
+def _has_non_finite(obj: Any) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(value) for value in obj)
+    return False
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> Optional[bytes]:
+    """Encode with orjson, or return None if the stdlib must be used."""
+    try:
+        data: bytes = orjson.dumps(obj, **kwargs)
+    except TypeError:
+        # Non-str keys, integers wider than 64 bits, etc.
+        return None
+    # orjson writes NaN and Infinity as null. Only walk the object when
+    # the output could contain one.
+    if b"null" in data and _has_non_finite(obj):
+        return None
+    return data
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Decode a JSON document from ``str`` or UTF-8 ``bytes``.
+
+    Raises ``json.JSONDecodeError`` on invalid JSON and
+    ``UnicodeDecodeError`` on bytes that are not valid UTF-8.
+    """
+    if orjson is not None:
+        if not _may_have_wide_int(data):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # orjson is stricter than the stdlib (NaN, Infinity). Let
+                # the stdlib have the final say so the set of accepted
+                # documents does not depend on the backend.
+                pass
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return _json_decode(data)
+
+
+def dumps(obj: Any) -> str:
+    """Encode *obj* as compact JSON, leaving non-ASCII text unescaped."""
+    if orjson is not None:
+        data = _orjson_dumps(obj)
+        if data is not None:
+            return data.decode("utf-8")
+    return _json_encode(obj)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Like ``dumps``, but return UTF-8 ``bytes`` for binary writers."""
+    if orjson is not None:
+        data = _orjson_dumps(obj)
+        if data is not None:
+            return data
+    return _json_encode(obj).encode("utf-8")
+
+
+def dumps_indented(
+    obj: Any, default: Optional[Callable[[Any], Any]] = None
+) -> str:
+    """Encode *obj* as JSON indented by two spaces, for display.
+
+    *default* is called for objects that are not natively serializable,
+    as with ``json.dumps``.
+    """
+    if orjson is not None:
+        data = _orjson_dumps(obj, default=default, option=orjson.OPT_INDENT_2)
+        if data is not None:
+            return data.decode("utf-8")
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=default)
@@ -1,12 +1,14 @@
 """README.md with YAML frontmatter for arkiv archives."""
 
-import yaml
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, Tuple, Union
 
+from . import yamlio
+from .record import _DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class Readme:
     """ECHO-compliant README with YAML frontmatter + markdown body.
 
@@ -24,24 +26,36 @@ def split_frontmatter(text: str) -> Tuple[str, str]:
     Frontmatter is delimited by --- on its own line at the start.
     Returns ("", text) if no frontmatter found.
     """
-    lines = text.split("\n")
+    # Slice the original string instead of splitting it into lines, so a
+    # long body is never copied line by line.
+    first_end = text.find("\n")
 
     # Must start with ---
-    if not lines or lines[0].strip() != "---":
+    if first_end == -1 or text[:first_end].strip() != "---":
         return ("", text)
 
-    # Find closing ---
-    for i in range(1, len(lines)):
-        if lines[i].strip() == "---":
-            fm = "\n".join(lines[1:i])
-            body = "\n".join(lines[i + 1 :])
-            # Strip leading newline from body
-            if body.startswith("\n"):
-                body = body[1:]
-            return (fm, body)
-
-    # No closing delimiter — treat entire content as body
-    return ("", text)
+    # Find closing --- (the first later line that is only ---)
+    fm_start = first_end + 1
+    pos = fm_start
+    while True:
+        hit = text.find("---", pos)
+        if hit == -1:
+            # No closing delimiter — treat entire content as body
+            return ("", text)
+        line_start = text.rfind("\n", fm_start - 1, hit) + 1
+        line_end = text.find("\n", hit)
+        if line_end == -1:
+            line_end = len(text)
+        if text[line_start:line_end].strip() == "---":
+            break
+        pos = line_end
+
+    fm = text[fm_start:max(line_start - 1, fm_start)]
+    body = text[line_end + 1 :]
+    # Strip leading newline from body
+    if body.startswith("\n"):
+        body = body[1:]
+    return (fm, body)
 
 
 def parse_readme(path: Union[str, Path]) -> Readme:
@@ -50,7 +64,7 @@ def parse_readme(path: Union[str, Path]) -> Readme:
     text = path.read_text(encoding="utf-8")
     fm_str, body = split_frontmatter(text)
 
-    frontmatter = yaml.safe_load(fm_str) if fm_str else {}
+    frontmatter = yamlio.safe_load(fm_str) if fm_str else {}
     if not isinstance(frontmatter, dict):
         frontmatter = {}
 
@@ -65,12 +79,7 @@ def save_readme(readme: Readme, path: Union[str, Path]) -> None:
     if readme.frontmatter:
         parts.append("---")
         parts.append(
-            yaml.dump(
-                readme.frontmatter,
-                default_flow_style=False,
-                allow_unicode=True,
-                sort_keys=False,
-            ).rstrip()
+            yamlio.dump(readme.frontmatter).rstrip()
         )
         parts.append("---")
         if readme.body:
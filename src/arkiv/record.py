@@ -1,15 +1,23 @@
 """Universal record format."""
 
 import json
-from dataclasses import dataclass, fields
+import sys
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterator, Optional, Union
 
+from . import jsonio
 
-KNOWN_FIELDS = {"mimetype", "uri", "content", "timestamp", "metadata"}
 
+KNOWN_FIELDS = frozenset({"mimetype", "uri", "content", "timestamp", "metadata"})
 
-@dataclass
+# Records are created one per JSONL line; without a per-instance __dict__
+# they are smaller and faster to build. dataclass(slots=) needs 3.10+.
+# Also used by the other dataclasses in the package.
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Record:
     """A single arkiv record.
 
@@ -24,28 +32,42 @@ class Record:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dict, excluding None fields."""
-        return {
-            f.name: getattr(self, f.name)
-            for f in fields(self)
-            if getattr(self, f.name) is not None
-        }
+        # Spelled out per field: this runs once per record written.
+        d: Dict[str, Any] = {}
+        if self.mimetype is not None:
+            d["mimetype"] = self.mimetype
+        if self.uri is not None:
+            d["uri"] = self.uri
+        if self.content is not None:
+            d["content"] = self.content
+        if self.timestamp is not None:
+            d["timestamp"] = self.timestamp
+        if self.metadata is not None:
+            d["metadata"] = self.metadata
+        return d
 
     def to_json(self) -> str:
         """Serialize to JSON string."""
-        return json.dumps(self.to_dict(), ensure_ascii=False)
+        return jsonio.dumps(self.to_dict())
 
 
 def parse_record(data: Dict[str, Any]) -> Record:
     """Parse a dict into a Record.
 
     Known fields (mimetype, uri, content, timestamp, metadata) are
-    extracted. Unknown fields are merged into metadata.
+    extracted. Unknown fields are merged into metadata. When there are
+    none, the record shares ``data["metadata"]`` instead of copying it.
     """
-    metadata = dict(data["metadata"]) if "metadata" in data else None
-
-    # Collect unknown fields into metadata
-    unknown = {k: v for k, v in data.items() if k not in KNOWN_FIELDS}
-    if unknown:
+    metadata = None
+    if "metadata" in data:
+        metadata = data["metadata"]
+        if not isinstance(metadata, dict):
+            metadata = dict(metadata)
+
+    # Collect unknown fields into metadata. Most records have none, and
+    # then the decoded metadata dict is used as is rather than copied.
+    if not data.keys() <= KNOWN_FIELDS:
+        unknown = {k: v for k, v in data.items() if k not in KNOWN_FIELDS}
         metadata = {**(metadata or {}), **unknown}
 
     return Record(
@@ -57,19 +79,50 @@ def parse_record(data: Dict[str, Any]) -> Record:
     )
 
 
-def parse_jsonl(path: Union[str, Path]) -> Iterator[Record]:
-    """Parse a JSONL file, yielding Records.
-
-    Skips blank lines and invalid JSON.
-    """
-    with open(path, "r", encoding="utf-8") as f:
+def _iter_jsonl_objects(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """Yield each JSON object in a JSONL file, skipping anything else."""
+    # Binary mode: lines go to the decoder as raw UTF-8 bytes, skipping a
+    # decode step when orjson is available.
+    with open(path, "rb") as f:
         for line in f:
             line = line.strip()
-            if not line:
+            # Only an object can be a record; blank lines, arrays and
+            # other junk are skipped without being decoded.
+            if not line.startswith(b"{"):
                 continue
             try:
-                data = json.loads(line)
+                data = jsonio.loads(line)
             except json.JSONDecodeError:
                 continue
             if isinstance(data, dict):
-                yield parse_record(data)
+                yield data
+
+
+def parse_jsonl(path: Union[str, Path]) -> Iterator[Record]:
+    """Parse a JSONL file, yielding Records.
+
+    Skips blank lines and invalid JSON.
+    """
+    for data in _iter_jsonl_objects(path):
+        yield parse_record(data)
+
+
+def iter_jsonl_metadata(
+    path: Union[str, Path],
+) -> Iterator[Optional[Dict[str, Any]]]:
+    """Yield the metadata of each record in a JSONL file.
+
+    Equivalent to ``(r.metadata for r in parse_jsonl(path))``, but records
+    without unknown fields hand over their metadata dict as decoded,
+    without building a Record or copying the dict.
+    """
+    for data in _iter_jsonl_objects(path):
+        if data.keys() <= KNOWN_FIELDS:
+            metadata = data.get("metadata")
+            if metadata is None and "metadata" not in data:
+                yield None
+                continue
+            if isinstance(metadata, dict):
+                yield metadata or None
+                continue
+        yield parse_record(data).metadata
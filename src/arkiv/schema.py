@@ -4,14 +4,13 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
-import yaml
-
-from .record import parse_jsonl
+from . import yamlio
+from .record import _DATACLASS_SLOTS, iter_jsonl_metadata
 
 MAX_ENUM_VALUES = 20
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class SchemaEntry:
     """Discovered schema for a single metadata key."""
 
@@ -40,7 +39,23 @@ class CollectionSchema:
     metadata_keys: Dict[str, SchemaEntry] = field(default_factory=dict)
 
 
+# Exact-type lookup for the types JSON decoding produces; subclasses
+# (and anything else) go through the isinstance chain.
+_JSON_TYPE_NAMES = {
+    type(None): "null",
+    bool: "boolean",
+    int: "number",
+    float: "number",
+    str: "string",
+    list: "array",
+    dict: "object",
+}
+
+
 def _json_type(value: Any) -> str:
+    name = _JSON_TYPE_NAMES.get(type(value))
+    if name is not None:
+        return name
     if value is None:
         return "null"
     if isinstance(value, bool):
@@ -83,6 +98,82 @@ def _flatten_metadata(
     return out
 
 
+_SCALAR_TYPES = (str, int, float, bool)
+
+
+class SchemaAccumulator:
+    """Incrementally discover metadata key schemas, one record at a time.
+
+    Lets callers that already iterate records (e.g. an import) build the
+    schema in the same pass instead of re-reading the data::
+
+        acc = SchemaAccumulator()
+        for record in records:
+            acc.update(record.metadata)
+        schema = acc.finalize()
+    """
+
+    # Per-key state is one list, so the hot loop does a single dict probe:
+    # [count, type of the last value seen, set of scalar values (None once
+    # a non-scalar or the MAX_ENUM_VALUES+1th value shows up), first value
+    # seen].
+
+    def __init__(self) -> None:
+        self._keys: Dict[str, list] = {}
+
+    def update(self, metadata: Optional[Dict[str, Any]]) -> None:
+        """Fold one record's metadata dict into the schema."""
+        if not metadata:
+            return
+        # Most metadata is flat; only build a flattened copy when needed.
+        items = metadata.items()
+        for value in metadata.values():
+            if isinstance(value, dict):
+                items = _flatten_metadata(metadata).items()
+                break
+
+        keys = self._keys
+        type_names = _JSON_TYPE_NAMES
+        for key, value in items:
+            type_ = type_names.get(type(value)) or _json_type(value)
+            state = keys.get(key)
+            if state is None:
+                keys[key] = [
+                    1,
+                    type_,
+                    {value} if isinstance(value, _SCALAR_TYPES) else None,
+                    value,
+                ]
+                continue
+            state[0] += 1
+            state[1] = type_
+            # Track enumerable values; drop them for non-scalar types, and
+            # as soon as there are too many to be an enum
+            values = state[2]
+            if values is not None:
+                if isinstance(value, _SCALAR_TYPES):
+                    values.add(value)
+                    if len(values) > MAX_ENUM_VALUES:
+                        state[2] = None
+                else:
+                    state[2] = None
+
+    def finalize(self) -> Dict[str, SchemaEntry]:
+        """Return the discovered schema, keyed by (dotted) metadata key."""
+        result = {}
+        for key, (count, type_, values_set, example) in self._keys.items():
+            if values_set is not None and len(values_set) <= MAX_ENUM_VALUES:
+                if all(isinstance(v, str) for v in values_set):
+                    values = sorted(values_set)
+                else:
+                    values = list(values_set)
+                entry = SchemaEntry(type=type_, count=count, values=values)
+            else:
+                entry = SchemaEntry(type=type_, count=count, example=example)
+            result[key] = entry
+        return result
+
+
 def discover_schema_from_metadata(
     metadata_iter,
 ) -> Dict[str, SchemaEntry]:
@@ -94,60 +185,29 @@ def discover_schema_from_metadata(
     Shared core used by both ``discover_schema(path)`` (reads JSONL) and
     ``Database.refresh_schema(collection)`` (reads from SQLite).
     """
-    key_counts: Dict[str, int] = {}
-    key_types: Dict[str, str] = {}
-    key_values: Dict[str, set] = {}
-    key_example: Dict[str, Any] = {}
-
+    acc = SchemaAccumulator()
     for metadata in metadata_iter:
-        if not metadata:
-            continue
-        for key, value in _flatten_metadata(metadata).items():
-            key_counts[key] = key_counts.get(key, 0) + 1
-            key_types[key] = _json_type(value)
+        acc.update(metadata)
+    return acc.finalize()
 
-            if key not in key_example:
-                key_example[key] = value
 
-            # Track enumerable values; set to None for non-scalar types
-            if key not in key_values:
-                key_values[key] = set()
-            if key_values[key] is None:
-                continue
-            if isinstance(value, (str, int, float, bool)):
-                key_values[key].add(value)
-            else:
-                key_values[key] = None
+def discover_schema(path: Union[str, Path]) -> Dict[str, SchemaEntry]:
+    """Scan a JSONL file and discover metadata key schemas."""
+    return discover_schema_from_metadata(iter_jsonl_metadata(path))
 
-    result = {}
-    for key in key_counts:
-        values_set = key_values.get(key)
-        if values_set is not None and len(values_set) <= MAX_ENUM_VALUES:
-            if all(isinstance(v, str) for v in values_set):
-                values = sorted(str(v) for v in values_set)
-            else:
-                values = list(values_set)
-            entry = SchemaEntry(
-                type=key_types[key],
-                count=key_counts[key],
-                values=values,
-            )
-        else:
-            entry = SchemaEntry(
-                type=key_types[key],
-                count=key_counts[key],
-                example=key_example[key],
-            )
-        result[key] = entry
 
-    return result
+def discover_collection_schema(path: Union[str, Path]) -> CollectionSchema:
+    """Scan a JSONL file once, counting records and discovering metadata keys."""
+    record_count = 0
 
+    def metadata_iter():
+        nonlocal record_count
+        for metadata in iter_jsonl_metadata(path):
+            record_count += 1
+            yield metadata
 
-def discover_schema(path: Union[str, Path]) -> Dict[str, SchemaEntry]:
-    """Scan a JSONL file and discover metadata key schemas."""
-    return discover_schema_from_metadata(
-        record.metadata for record in parse_jsonl(path)
-    )
+    metadata_keys = discover_schema_from_metadata(metadata_iter())
+    return CollectionSchema(record_count=record_count, metadata_keys=metadata_keys)
 
 
 def load_schema_yaml(path: Union[str, Path]) -> Dict[str, CollectionSchema]:
@@ -156,7 +216,7 @@ def load_schema_yaml(path: Union[str, Path]) -> Dict[str, CollectionSchema]:
     Returns a dict mapping collection name to CollectionSchema.
     """
     path = Path(path)
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    data = yamlio.safe_load(path.read_text(encoding="utf-8"))
     if not isinstance(data, dict):
         return {}
 
@@ -209,12 +269,7 @@ def save_schema_yaml(
         data[coll_name] = coll_dict
 
     header = "# Auto-generated by arkiv. Edit freely.\n"
-    body = yaml.dump(
-        data,
-        default_flow_style=False,
-        allow_unicode=True,
-        sort_keys=False,
-    )
+    body = yamlio.dump(data)
     path.write_text(header + body, encoding="utf-8")
 
 
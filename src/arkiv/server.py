@@ -4,6 +4,7 @@ import json
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+from . import jsonio
 from .database import Database
 
 
@@ -13,12 +14,33 @@ class ArkivServer:
     Derives all metadata from the database — no external manifest needed.
     """
 
-    def __init__(self, db_path: Union[str, Path], writable: bool = False):
-        self.db = Database(db_path, read_only=not writable)
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        writable: bool = False,
+        db: Optional[Database] = None,
+    ):
+        # Reuse an already-open connection (e.g. the one the CLI resolved)
+        # rather than opening a second one to the same file.
+        self.db = db if db is not None else Database(db_path, read_only=not writable)
         self.writable = writable
+        # The manifest, valid while the database state it was built at
+        # is unchanged (get_info/get_schema are cached by Database).
+        self._manifest: Optional[Dict[str, Any]] = None
+        self._manifest_state: Optional[tuple] = None
 
     def get_manifest(self) -> Dict[str, Any]:
-        """Return archive overview from _metadata + DB info + schema."""
+        """Return archive overview from _metadata + DB info + schema.
+
+        Cached until the database changes, like ``Database.get_schema``.
+        """
+        state = self.db.state_token()
+        if self._manifest is None or state != self._manifest_state:
+            self._manifest = self._build_manifest()
+            self._manifest_state = state
+        return self._manifest
+
+    def _build_manifest(self) -> Dict[str, Any]:
         readme = self.db.get_readme()
         fm = readme.frontmatter if readme else {}
         result = {k: fm[k] for k in ("name", "description") if k in fm}
@@ -31,6 +53,7 @@ class ArkivServer:
             if isinstance(item, dict) and "path" in item:
                 content_desc[Path(item["path"]).stem] = item.get("description")
 
+        schemas = self.get_schema()
         for name, data in info["collections"].items():
             coll = {
                 "file": f"{name}.jsonl",
@@ -38,16 +61,17 @@ class ArkivServer:
             }
             if name in content_desc and content_desc[name]:
                 coll["description"] = content_desc[name]
-            schema = self.db.get_schema(name)
-            if schema and "metadata_keys" in schema:
-                coll["schema"] = {"metadata_keys": schema["metadata_keys"]}
+            schema = schemas.get(name)
+            coll["schema"] = {
+                "metadata_keys": schema["metadata_keys"] if schema else {}
+            }
             collections.append(coll)
 
         result["collections"] = collections
         return result
 
     def get_schema(self, collection: Optional[str] = None) -> Dict[str, Any]:
-        """Return pre-computed metadata schema."""
+        """Return pre-computed metadata schema (cached by the database)."""
         return self.db.get_schema(collection)
 
     def sql_query(self, query: str) -> List[Dict[str, Any]]:
@@ -58,7 +82,9 @@ class ArkivServer:
         self.db.close()
 
 
-def run_mcp_server(db_path: str, writable: bool = False) -> None:
+def run_mcp_server(
+    db_path: str, writable: bool = False, db: Optional[Database] = None
+) -> None:
     """Run the arkiv MCP server over stdio."""
     try:
         from mcp.server.fastmcp import FastMCP
@@ -68,23 +94,23 @@ def run_mcp_server(db_path: str, writable: bool = False) -> None:
         )
 
     mcp = FastMCP("arkiv")
-    arkiv = ArkivServer(db_path, writable=writable)
+    arkiv = ArkivServer(db_path, writable=writable, db=db)
 
     @mcp.tool()
     def get_manifest() -> str:
         """Get the archive manifest: lists all collections with record counts and pre-computed metadata schemas. Call this first to understand what data is available."""
-        return json.dumps(arkiv.get_manifest(), indent=2)
+        return jsonio.dumps_indented(arkiv.get_manifest())
 
     @mcp.tool()
     def get_schema(collection: Optional[str] = None) -> str:
         """Get metadata schema for a collection. Shows all metadata keys, their types, counts, and sample values. Use this to understand what fields are queryable via json_extract(metadata, '$.key')."""
-        return json.dumps(arkiv.get_schema(collection), indent=2)
+        return jsonio.dumps_indented(arkiv.get_schema(collection))
 
     @mcp.tool()
     def sql_query(query: str) -> str:
         """Run a read-only SQL query against the archive. The 'records' table has columns: id, collection, mimetype, uri, content, timestamp, metadata (JSON). Use json_extract(metadata, '$.key') to query metadata fields. Only SELECT statements are allowed."""
         results = arkiv.sql_query(query)
-        return json.dumps(results, indent=2, default=str)
+        return jsonio.dumps_indented(results, default=str)
 
     if writable:
         @mcp.tool()
@@ -108,20 +134,19 @@ def run_mcp_server(db_path: str, writable: bool = False) -> None:
             meta_dict = None
             if metadata:
                 try:
-                    meta_dict = json.loads(metadata)
+                    meta_dict = jsonio.loads(metadata)
                 except json.JSONDecodeError as e:
-                    return json.dumps(
-                        {"error": f"metadata is not valid JSON: {e}"}, indent=2
+                    return jsonio.dumps_indented(
+                        {"error": f"metadata is not valid JSON: {e}"}
                     )
                 if not isinstance(meta_dict, dict):
-                    return json.dumps(
+                    return jsonio.dumps_indented(
                         {
                             "error": (
                                 "metadata must be a JSON object, "
                                 f"got {type(meta_dict).__name__}"
                             )
-                        },
-                        indent=2,
+                        }
                     )
 
             ts = timestamp if timestamp else None
@@ -134,7 +159,7 @@ def run_mcp_server(db_path: str, writable: bool = False) -> None:
                     metadata=meta_dict,
                 )
             except ValueError as e:
-                return json.dumps({"error": str(e)}, indent=2)
-            return json.dumps(result, indent=2)
+                return jsonio.dumps_indented({"error": str(e)})
+            return jsonio.dumps_indented(result)
 
     mcp.run(transport="stdio")
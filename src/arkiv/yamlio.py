@@ -0,0 +1,36 @@
+"""YAML loading and dumping for README frontmatter and schema.yaml.
+
+Loading goes through libyaml's ``CSafeLoader`` when PyYAML was built
+against it, which is several times faster than the pure-Python loader,
+and accepts the same documents.
+
+Dumping stays on the pure-Python emitter: libyaml escapes characters
+outside the Basic Multilingual Plane (``"\\U0001F600"`` instead of the
+emoji itself) even with ``allow_unicode``, and archives are meant to be
+read by people.
+"""
+
+from typing import Any
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+
+def safe_load(text: str) -> Any:
+    """Parse a YAML document, like ``yaml.safe_load``."""
+    return yaml.load(text, Loader=_SafeLoader)
+
+
+def dump(data: Any) -> str:
+    """Dump *data* as block-style YAML, keeping key order and Unicode."""
+    text: str = yaml.dump(
+        data,
+        default_flow_style=False,
+        allow_unicode=True,
+        sort_keys=False,
+    )
+    return text
@@ -6,8 +6,6 @@ round-trip through compressed bundles.
 from __future__ import annotations
 
 import json
-import subprocess
-import sys
 import sqlite3
 import tarfile
 import zipfile
@@ -17,14 +15,7 @@ import pytest
 
 from arkiv.bundle import is_bundle, pack_bundle, unpack_bundle
 
-
-def run_arkiv(*args):
-    result = subprocess.run(
-        [sys.executable, "-m", "arkiv.cli", *args],
-        capture_output=True,
-        text=True,
-    )
-    return result
+from .cli_runner import run_arkiv
 
 
 # ── library-level tests ────────────────────────────────────────
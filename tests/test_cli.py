@@ -5,14 +5,7 @@ import subprocess
 import sys
 import pytest
 
-
-def run_arkiv(*args):
-    result = subprocess.run(
-        [sys.executable, "-m", "arkiv.cli", *args],
-        capture_output=True,
-        text=True,
-    )
-    return result
+from .cli_runner import run_arkiv
 
 
 class TestCLI:
@@ -21,6 +14,44 @@ class TestCLI:
         result = run_arkiv("--version")
         assert __version__ in result.stdout
 
+    def test_module_entry_point(self, tmp_path):
+        """The other tests call main() in-process; check the real entry point."""
+        f = tmp_path / "data.jsonl"
+        f.write_text('{"content": "hi", "metadata": {"role": "user"}}\n')
+        result = subprocess.run(
+            [sys.executable, "-m", "arkiv.cli", "schema", str(f)],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stderr
+        assert "role" in json.loads(result.stdout)
+
+    def test_version_does_not_import_heavy_modules(self):
+        code = (
+            "import sys\n"
+            "from arkiv.cli import main\n"
+            "sys.argv = ['arkiv', '--version']\n"
+            "try:\n"
+            "    main()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "loaded = [m for m in ('yaml', 'sqlite3', 'arkiv.database', 'arkiv.schema')\n"
+            "          if m in sys.modules]\n"
+            "print('loaded=' + ','.join(loaded))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+        assert result.returncode == 0, result.stderr
+        assert "loaded=\n" in result.stdout
+
+    def test_parser_for_one_subcommand(self):
+        from arkiv.cli import _build_parser, cmd_query
+
+        args = _build_parser("query").parse_args(["query", "x.db", "SELECT 1"])
+        assert args.func is cmd_query
+        assert args.sql == "SELECT 1"
+
     def test_help(self):
         result = run_arkiv("--help")
         assert "convert" in result.stdout
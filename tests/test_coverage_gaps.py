@@ -12,8 +12,6 @@ Covers uncovered lines and edge cases in:
 """
 
 import json
-import subprocess
-import sys
 
 import pytest
 
@@ -29,6 +27,8 @@ from arkiv.schema import (
 from arkiv.database import Database
 from arkiv.readme import Readme, parse_readme, save_readme
 
+from .cli_runner import run_arkiv
+
 
 # ---------------------------------------------------------------------------
 # schema.py coverage gaps
@@ -312,19 +312,10 @@ class TestImportReadmeEdgeCases:
 
 
 # ---------------------------------------------------------------------------
-# cli.py coverage gaps (via subprocess)
+# cli.py coverage gaps (via the CLI entry point)
 # ---------------------------------------------------------------------------
 
 
-def run_arkiv(*args):
-    result = subprocess.run(
-        [sys.executable, "-m", "arkiv.cli", *args],
-        capture_output=True,
-        text=True,
-    )
-    return result
-
-
 class TestCLIRequireJsonl:
     """Covers _require_jsonl guard."""
 
@@ -343,6 +334,53 @@ class TestCLIRequireJsonl:
         assert "database" in result.stderr.lower()
 
 
+class TestCLIDetectChunks:
+    LINES = [
+        '{"content": "a", "url": "x"}',
+        "",
+        "not json",
+        '{"metadata": {"role": "user"}}',
+        "[1]",
+        '{"uri": "u", "metadata": {"n": 1}}',
+        "bad again",
+    ]
+
+    def _write(self, tmp_path):
+        f = tmp_path / "test.jsonl"
+        f.write_text("\n".join(self.LINES))  # no trailing newline
+        return f
+
+    def test_chunks_cover_each_line_once(self, tmp_path):
+        from arkiv.cli import _detect_chunk
+
+        f = self._write(tmp_path)
+        size = f.stat().st_size
+        whole = _detect_chunk(f, 0, size)
+        for cut in range(size + 1):
+            a = _detect_chunk(f, 0, cut)
+            b = _detect_chunk(f, cut, size)
+            assert a[0] + b[0] == whole[0] == len(self.LINES)
+            assert a[1] + b[1] == whole[1]
+            assert a[2] + b[2] == whole[2]
+            assert a[3] | b[3] == whole[3]
+            assert a[5] | b[5] == whole[5]
+
+    def test_parallel_scan_matches_serial(self, tmp_path, monkeypatch):
+        import arkiv.cli as cli
+
+        f = self._write(tmp_path)
+        serial = cli._scan_detect(f)
+        monkeypatch.setattr(cli, "_PARALLEL_DETECT_MIN_BYTES", 0)
+        monkeypatch.setattr("os.cpu_count", lambda: 3)
+        parallel = cli._scan_detect(f)
+        assert parallel == serial
+        assert serial[5] == [
+            "Line 3: invalid JSON",
+            "Line 5: not a JSON object",
+            "Line 7: invalid JSON",
+        ]
+
+
 class TestCLIDetectEdgeCases:
     def test_detect_non_json_object_line(self, tmp_path):
         f = tmp_path / "test.jsonl"
@@ -382,6 +420,22 @@ class TestCLIDetectEdgeCases:
 
 
 class TestCLIFixEdgeCases:
+    def test_fix_handles_escaped_keys(self, tmp_path):
+        f = tmp_path / "test.jsonl"
+        f.write_text('{"\\u0075rl": "https://example.com"}\n')
+        result = run_arkiv("fix", str(f))
+        assert result.returncode == 0
+        assert json.loads(f.read_text())["uri"] == "https://example.com"
+
+    def test_fix_passes_through_untouched_lines_verbatim(self, tmp_path):
+        f = tmp_path / "test.jsonl"
+        original = '{"content": "a",   "uri": "x"}\n{"url": "y"}\n'
+        f.write_text(original)
+        result = run_arkiv("fix", str(f))
+        assert result.returncode == 0
+        assert json.loads(result.stdout)["fixed"] == 1
+        assert f.read_text().split("\n")[0] == '{"content": "a",   "uri": "x"}'
+
     def test_fix_preserves_blank_lines(self, tmp_path):
         f = tmp_path / "test.jsonl"
         f.write_text('{"url": "https://example.com"}\n\n{"content": "ok"}\n')
@@ -408,6 +462,54 @@ class TestCLIFixEdgeCases:
         lines = f.read_text().strip().split("\n")
         assert lines[0] == "[1, 2, 3]"
 
+    def test_fix_leaves_no_temp_files(self, tmp_path):
+        f = tmp_path / "test.jsonl"
+        f.write_text('{"url": "https://example.com"}\n')
+        result = run_arkiv("fix", str(f))
+        assert result.returncode == 0
+        assert [p.name for p in tmp_path.iterdir()] == ["test.jsonl"]
+
+    def test_fix_preserves_file_mode(self, tmp_path):
+        f = tmp_path / "test.jsonl"
+        f.write_text('{"url": "https://example.com"}\n')
+        f.chmod(0o644)
+        run_arkiv("fix", str(f))
+        assert f.stat().st_mode & 0o777 == 0o644
+
+    def test_fix_invalid_utf8_leaves_file_untouched(self, tmp_path):
+        f = tmp_path / "test.jsonl"
+        original = b'{"url": "\xff"}\n'
+        f.write_bytes(original)
+        result = run_arkiv("fix", str(f))
+        assert result.returncode == 1
+        assert f.read_bytes() == original
+        assert [p.name for p in tmp_path.iterdir()] == ["test.jsonl"]
+
+    def test_fix_writes_through_symlink(self, tmp_path):
+        target = tmp_path / "data" / "test.jsonl"
+        target.parent.mkdir()
+        target.write_text('{"url": "https://example.com"}\n')
+        link = tmp_path / "link.jsonl"
+        link.symlink_to(target)
+        result = run_arkiv("fix", str(link))
+        assert result.returncode == 0
+        assert link.is_symlink()
+        assert '"uri":"https://example.com"' in target.read_text()
+
+    def test_fix_reports_os_errors(self, tmp_path, monkeypatch):
+        import tempfile
+
+        def denied(*args, **kwargs):
+            raise PermissionError(13, "Permission denied", str(tmp_path))
+
+        monkeypatch.setattr(tempfile, "mkstemp", denied)
+        f = tmp_path / "test.jsonl"
+        f.write_text('{"url": "https://example.com"}\n')
+        result = run_arkiv("fix", str(f))
+        assert result.returncode == 1
+        assert result.stderr.startswith("Error: ")
+        assert "Permission denied" in result.stderr
+
 
 class TestCLINoCommandExits:
     def test_no_command_exits_1(self):
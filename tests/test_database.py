@@ -93,6 +93,53 @@ class TestImport:
         conn.close()
 
 
+class TestBulkLoadIndexes:
+    INDEXES = [
+        "idx_records_collection",
+        "idx_records_mimetype",
+        "idx_records_timestamp",
+    ]
+
+    def _indexes(self, db):
+        return sorted(
+            row[0]
+            for row in db.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' "
+                "AND tbl_name = 'records'"
+            )
+        )
+
+    def test_indexes_rebuilt_after_import(self, tmp_path):
+        f = tmp_path / "test.jsonl"
+        f.write_text('{"content": "a"}\n{"content": "b"}\n')
+        with Database(":memory:") as db:
+            db.import_jsonl(f)
+            assert self._indexes(db) == self.INDEXES
+            db.import_jsonl(f, collection="other")
+            assert self._indexes(db) == self.INDEXES
+            assert db.get_info()["total_records"] == 4
+
+    def test_failed_import_keeps_indexes_and_rows(self, tmp_path):
+        good = tmp_path / "good.jsonl"
+        good.write_text('{"content": "a"}\n')
+        bad = tmp_path / "bad.jsonl"
+        bad.write_bytes(b'{"content": "\xff"}\n')
+        with Database(":memory:") as db:
+            db.import_jsonl(good, collection="test")
+            with pytest.raises(UnicodeDecodeError):
+                db.import_jsonl(bad, collection="test")
+            assert self._indexes(db) == self.INDEXES
+            assert db.get_info()["total_records"] == 1
+
+    def test_schema_lookups_use_index(self):
+        with Database(":memory:") as db:
+            plan = db.conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM _schema WHERE collection = ?",
+                ("test",),
+            ).fetchall()
+        assert "idx_schema_collection" in " ".join(str(row) for row in plan)
+
+
 class TestQuery:
     def test_sql_query(self, tmp_path):
         f = tmp_path / "test.jsonl"
@@ -123,6 +170,34 @@ class TestQuery:
         assert results[0]["mimetype"] == "text/plain"
         db.close()
 
+    def test_query_params(self):
+        db = Database(":memory:")
+        db.insert_record("test", "hello")
+        db.insert_record("test", "world")
+        results = db.query("SELECT content FROM records WHERE content = ?", ("world",))
+        assert results == [{"content": "world"}]
+        db.close()
+
+    def test_iter_query_streams_rows(self, tmp_path):
+        f = tmp_path / "test.jsonl"
+        f.write_text("".join(f'{{"content": "r{i}"}}\n' for i in range(2500)))
+        db = Database(":memory:")
+        db.import_jsonl(f, collection="test")
+        rows = db.iter_query(
+            "SELECT content FROM records WHERE content LIKE 'r%' ORDER BY id"
+        )
+        assert next(rows) == {"content": "r0"}
+        # The read-only guard is not left installed mid-iteration.
+        db.insert_record("test", "late")
+        assert sum(1 for _ in rows) == 2499
+        db.close()
+
+    def test_iter_query_rejects_writes(self):
+        db = Database(":memory:")
+        with pytest.raises(ValueError):
+            next(db.iter_query("DELETE FROM records"))
+        db.close()
+
     def test_query_rejects_writes(self, tmp_path):
         db_path = tmp_path / "test.db"
         db = Database(db_path)
@@ -152,6 +227,21 @@ class TestReadOnly:
             db.conn.execute("INSERT INTO records (content) VALUES ('bad')")
         db.close()
 
+    def test_connection_pragmas(self, tmp_path):
+        db_path = tmp_path / "test.db"
+        Database(db_path).close()
+        db = Database(db_path, read_only=True)
+        assert db.conn.execute("PRAGMA query_only").fetchone()[0] == 1
+        assert db.conn.execute("PRAGMA cache_size").fetchone()[0] == -65536
+        assert db.conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        db.close()
+
+    def test_context_manager_closes_connection(self):
+        with Database(":memory:") as db:
+            db.insert_record("test", "hello")
+        with pytest.raises(sqlite3.ProgrammingError):
+            db.conn.execute("SELECT 1")
+
 
 class TestReplaceSemantics:
     def test_double_import_replaces(self, tmp_path):
@@ -184,6 +274,12 @@ class TestReplaceSemantics:
 
 
 class TestQueryGuard:
+    def test_prefix_check_is_case_and_space_insensitive(self):
+        db = Database(":memory:")
+        assert db.query("\n  select 1 AS x") == [{"x": 1}]
+        assert db.query("with t AS (SELECT 2 AS y) SELECT y FROM t") == [{"y": 2}]
+        db.close()
+
     def test_with_insert_rejected(self, tmp_path):
         f = tmp_path / "test.jsonl"
         f.write_text('{"content": "hello"}\n')
@@ -221,7 +317,7 @@ class TestQueryGuard:
         """Authorizer blocks write attempts even with SQL comment prefix."""
         f = tmp_path / "test.jsonl"
         f.write_text('{"content": "hello"}\n')
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         db.import_jsonl(f, collection="test")
 
         with pytest.raises(ValueError):
@@ -232,11 +328,34 @@ class TestQueryGuard:
         db.close()
 
 
+class TestGetSchema:
+    def test_all_collections_in_one_result(self, tmp_path):
+        a = tmp_path / "a.jsonl"
+        a.write_text('{"metadata": {"x": 1}}\n')
+        b = tmp_path / "b.jsonl"
+        b.write_text('{"metadata": {"y": "v"}}\n')
+        with Database(":memory:") as db:
+            db.import_jsonl(a)
+            db.import_jsonl(b)
+            schema = db.get_schema()
+            assert list(schema) == ["a", "b"]
+            assert schema["a"] == db.get_schema("a")
+            assert list(schema["b"]["metadata_keys"]) == ["y"]
+
+    def test_unknown_collection_is_empty(self):
+        with Database(":memory:") as db:
+            assert db.get_schema("nope") == {
+                "collection": "nope",
+                "metadata_keys": {},
+            }
+            assert db.get_schema() == {}
+
+
 class TestSchemaDescription:
     def test_schema_has_description_column(self, tmp_path):
         f = tmp_path / "test.jsonl"
         f.write_text('{"metadata": {"role": "user"}}\n')
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         db.import_jsonl(f, collection="test")
 
         schema = db.get_schema("test")
@@ -252,7 +371,7 @@ class TestSchemaDescription:
             '{"metadata": {"role": "user"}}\n'
             '{"metadata": {"role": "assistant"}}\n'
         )
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         db.import_jsonl(f, collection="test")
 
         curated = {
@@ -273,7 +392,7 @@ class TestSchemaDescription:
 
         f = tmp_path / "test.jsonl"
         f.write_text('{"metadata": {"role": "user"}}\n')
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         db.import_jsonl(f, collection="test")
 
         curated = {
@@ -294,7 +413,7 @@ class TestSchemaDescription:
 
         f = tmp_path / "test.jsonl"
         f.write_text('{"metadata": {"role": "user"}}\n')
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         db.import_jsonl(f, collection="test")
 
         # Add curated description
@@ -314,10 +433,10 @@ class TestSchemaDescription:
 
 
 class TestReadmeMetadata:
-    def test_store_and_load_readme(self, tmp_path):
+    def test_store_and_load_readme(self):
         from arkiv.readme import Readme
 
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         readme = Readme(
             frontmatter={"name": "Test", "description": "A test"},
             body="# Test\n",
@@ -329,8 +448,8 @@ class TestReadmeMetadata:
         assert "# Test" in loaded.body
         db.close()
 
-    def test_load_returns_none_when_empty(self, tmp_path):
-        db = Database(tmp_path / "test.db")
+    def test_load_returns_none_when_empty(self):
+        db = Database(":memory:")
         loaded = db._load_readme_metadata()
         assert loaded is None
         db.close()
@@ -344,7 +463,7 @@ class TestReadmeMetadata:
         )
         (tmp_path / "README.md").write_text(readme_text)
 
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         count = db.import_readme(tmp_path / "README.md")
         assert count == 1
 
@@ -368,7 +487,7 @@ class TestReadmeMetadata:
         )
         (tmp_path / "schema.yaml").write_text(schema_yaml)
 
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         db.import_readme(tmp_path / "README.md")
 
         schema = db.get_schema("data")
@@ -378,8 +497,8 @@ class TestReadmeMetadata:
 
 
 class TestInsertRecord:
-    def test_basic_insert(self, tmp_path):
-        db = Database(tmp_path / "test.db")
+    def test_basic_insert(self):
+        db = Database(":memory:")
         result = db.insert_record("test", "hello world")
         assert result["id"] is not None
         assert result["collection"] == "test"
@@ -388,8 +507,8 @@ class TestInsertRecord:
         assert rows[0]["content"] == "hello world"
         db.close()
 
-    def test_insert_with_metadata(self, tmp_path):
-        db = Database(tmp_path / "test.db")
+    def test_insert_with_metadata(self):
+        db = Database(":memory:")
         db.insert_record("test", "msg", metadata={"role": "user", "session": "s1"})
         rows = db.query(
             "SELECT json_extract(metadata, '$.role') as role FROM records"
@@ -397,21 +516,21 @@ class TestInsertRecord:
         assert rows[0]["role"] == "user"
         db.close()
 
-    def test_insert_default_timestamp(self, tmp_path):
-        db = Database(tmp_path / "test.db")
+    def test_insert_default_timestamp(self):
+        db = Database(":memory:")
         result = db.insert_record("test", "msg")
         assert result["timestamp"] is not None
         assert "T" in result["timestamp"]
         db.close()
 
-    def test_insert_custom_timestamp(self, tmp_path):
-        db = Database(tmp_path / "test.db")
+    def test_insert_custom_timestamp(self):
+        db = Database(":memory:")
         result = db.insert_record("test", "msg", timestamp="2026-01-01T00:00:00Z")
         assert result["timestamp"] == "2026-01-01T00:00:00Z"
         db.close()
 
-    def test_insert_append_semantics(self, tmp_path):
-        db = Database(tmp_path / "test.db")
+    def test_insert_append_semantics(self):
+        db = Database(":memory:")
         db.insert_record("test", "first")
         db.insert_record("test", "second")
         rows = db.query("SELECT content FROM records WHERE collection = 'test' ORDER BY id")
@@ -420,19 +539,73 @@ class TestInsertRecord:
         assert rows[1]["content"] == "second"
         db.close()
 
-    def test_insert_validates_collection_name(self, tmp_path):
-        db = Database(tmp_path / "test.db")
+    def test_batch_commits_once(self, tmp_path):
+        db_path = tmp_path / "test.db"
+        with Database(db_path) as db:
+            with db.batch():
+                db.insert_record("test", "first")
+                db.insert_record("test", "second")
+                reader = Database(db_path, read_only=True)
+                assert reader.get_info()["total_records"] == 0
+            assert reader.get_info()["total_records"] == 2
+            reader.close()
+
+    def test_batch_rolls_back_on_error(self):
+        db = Database(":memory:")
+        db.insert_record("test", "kept")
+        with pytest.raises(RuntimeError):
+            with db.batch():
+                db.insert_record("test", "dropped")
+                raise RuntimeError("boom")
+        rows = db.query("SELECT content FROM records")
+        assert rows == [{"content": "kept"}]
+        db.close()
+
+    def test_failed_begin_does_not_leave_transaction_open(self, tmp_path):
+        class LockedOnBegin:
+            """Connection stand-in whose first BEGIN fails."""
+
+            def __init__(self, conn):
+                self._conn = conn
+                self.failed = False
+
+            def execute(self, sql, *args):
+                if sql == "BEGIN" and not self.failed:
+                    self.failed = True
+                    raise sqlite3.OperationalError("database is locked")
+                return self._conn.execute(sql, *args)
+
+            def __getattr__(self, name):
+                return getattr(self._conn, name)
+
+        f = tmp_path / "test.jsonl"
+        f.write_text('{"content": "a"}\n')
+        db_path = tmp_path / "test.db"
+        db = Database(db_path)
+        real_conn = db.conn
+        db.conn = LockedOnBegin(real_conn)
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            db.insert_record("test", "lost")
+        db.conn = real_conn
+        db.import_jsonl(f, collection="test")
+        db.close()
+
+        with Database(db_path, read_only=True) as reader:
+            assert reader.get_info()["total_records"] == 1
+
+    def test_insert_validates_collection_name(self):
+        db = Database(":memory:")
         with pytest.raises(ValueError, match="path separator"):
             db.insert_record("../escape", "msg")
         with pytest.raises(ValueError, match="dot"):
             db.insert_record(".hidden", "msg")
         db.close()
 
-    def test_insert_rejects_non_dict_metadata(self, tmp_path):
+    def test_insert_rejects_non_dict_metadata(self):
         """Metadata must be a dict or None. Lists, strings, numbers, etc.
         would silently produce invalid records that crash discover_schema
         on re-import."""
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         with pytest.raises(ValueError, match="metadata must be a dict"):
             db.insert_record("test", "msg", metadata=[1, 2, 3])
         with pytest.raises(ValueError, match="metadata must be a dict"):
@@ -441,17 +614,17 @@ class TestInsertRecord:
             db.insert_record("test", "msg", metadata=42)
         db.close()
 
-    def test_insert_rejects_empty_collection_name(self, tmp_path):
+    def test_insert_rejects_empty_collection_name(self):
         """Regression: empty collection name must not be silently accepted."""
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         with pytest.raises(ValueError, match="non-empty"):
             db.insert_record("", "msg")
         with pytest.raises(ValueError, match="non-empty"):
             db.insert_record("   ", "msg")
         db.close()
 
-    def test_insert_with_mimetype(self, tmp_path):
-        db = Database(tmp_path / "test.db")
+    def test_insert_with_mimetype(self):
+        db = Database(":memory:")
         db.insert_record("test", '{"key": "value"}', mimetype="application/json")
         rows = db.query("SELECT mimetype FROM records WHERE collection = 'test'")
         assert rows[0]["mimetype"] == "application/json"
@@ -465,7 +638,7 @@ class TestRefreshSchema:
     def test_insert_does_not_update_schema(self, tmp_path):
         """Establishes expected behavior: writes are invisible to get_schema
         until refresh_schema is called."""
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         f = tmp_path / "data.jsonl"
         f.write_text('{"metadata": {"role": "user"}}\n')
         db.import_jsonl(f, collection="data")
@@ -479,7 +652,7 @@ class TestRefreshSchema:
         db.close()
 
     def test_refresh_schema_picks_up_new_keys(self, tmp_path):
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         f = tmp_path / "data.jsonl"
         f.write_text('{"metadata": {"role": "user"}}\n')
         db.import_jsonl(f, collection="data")
@@ -493,7 +666,7 @@ class TestRefreshSchema:
         db.close()
 
     def test_refresh_schema_preserves_descriptions(self, tmp_path):
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         f = tmp_path / "data.jsonl"
         f.write_text('{"metadata": {"role": "user"}}\n')
         db.import_jsonl(f, collection="data")
@@ -512,8 +685,8 @@ class TestRefreshSchema:
         assert schema["metadata_keys"]["role"]["description"] == "Speaker identity"
         db.close()
 
-    def test_refresh_schema_validates_collection_name(self, tmp_path):
-        db = Database(tmp_path / "test.db")
+    def test_refresh_schema_validates_collection_name(self):
+        db = Database(":memory:")
         with pytest.raises(ValueError, match="path separator"):
             db.refresh_schema("../evil")
         db.close()
@@ -524,7 +697,7 @@ class TestPathTraversalGuard:
     code path that accepts a collection name, not just nested export."""
 
     def test_import_jsonl_rejects_path_traversal(self, tmp_path):
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         f = tmp_path / "data.jsonl"
         f.write_text('{"content": "hi"}\n')
         with pytest.raises(ValueError, match="path separator"):
@@ -532,7 +705,7 @@ class TestPathTraversalGuard:
         db.close()
 
     def test_import_jsonl_rejects_dot_prefix(self, tmp_path):
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         f = tmp_path / "data.jsonl"
         f.write_text('{"content": "hi"}\n')
         with pytest.raises(ValueError, match="dot"):
@@ -543,7 +716,7 @@ class TestPathTraversalGuard:
         """Even if unsafe names somehow got into the DB, flat export must
         reject them before writing files outside the output directory."""
         # Open DB read-write and inject a bad name directly (bypassing import_jsonl)
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         db.conn.execute(
             "INSERT INTO records (collection, content) VALUES (?, ?)",
             ("../pwn", "hello"),
@@ -567,3 +740,53 @@ class TestInfo:
         assert "test" in info["collections"]
         assert info["collections"]["test"]["record_count"] == 2
         db.close()
+
+    def test_get_info_cached_until_written(self):
+        with Database(":memory:") as db:
+            db.insert_record("test", "a")
+            db.get_info()
+            statements = []
+            db.conn.set_trace_callback(statements.append)
+            db.get_info()
+            db.conn.set_trace_callback(None)
+            assert not any("GROUP BY" in sql for sql in statements)
+            db.insert_record("test", "b")
+            assert db.get_info()["total_records"] == 2
+            db.conn.execute("DELETE FROM records")
+            assert db.get_info()["total_records"] == 0
+
+    def test_get_info_cache_dropped_on_rollback(self):
+        with Database(":memory:") as db:
+            db.insert_record("t", "kept")
+            with pytest.raises(RuntimeError):
+                with db.batch():
+                    db.insert_record("t", "dropped")
+                    assert db.get_info()["total_records"] == 2
+                    raise RuntimeError("boom")
+            assert db.get_info()["total_records"] == 1
+
+    def test_get_info_returns_a_copy(self):
+        with Database(":memory:") as db:
+            db.insert_record("test", "a", metadata={"role": "user"})
+            db.refresh_schema("test")
+            db.get_info()["collections"].clear()
+            db.get_schema()["test"]["metadata_keys"].clear()
+            assert db.get_info()["collections"] == {"test": {"record_count": 1}}
+            assert "role" in db.get_schema()["test"]["metadata_keys"]
+
+    def test_get_info_not_cached_across_direct_rollback(self):
+        with Database(":memory:") as db:
+            db.insert_record("t", "kept")
+            db.conn.execute("INSERT INTO records (collection) VALUES ('t')")
+            assert db.get_info()["total_records"] == 2
+            db.conn.rollback()
+            assert db.get_info()["total_records"] == 1
+
+    def test_get_info_sees_other_connections(self, tmp_path):
+        with Database(tmp_path / "test.db") as db:
+            db.insert_record("test", "a")
+            reader = Database(tmp_path / "test.db", read_only=True)
+            assert reader.get_info()["total_records"] == 1
+            db.insert_record("test", "b")
+            assert reader.get_info()["total_records"] == 2
+            reader.close()
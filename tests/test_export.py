@@ -12,7 +12,7 @@ class TestExport:
         # Create and populate DB
         f = tmp_path / "input.jsonl"
         f.write_text('{"content": "hello", "metadata": {"role": "user"}}\n')
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         db.import_jsonl(f, collection="conversations")
 
         # Export
@@ -29,7 +29,7 @@ class TestExport:
     def test_export_creates_readme(self, tmp_path):
         f = tmp_path / "input.jsonl"
         f.write_text('{"content": "a"}\n{"content": "b"}\n')
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         db.import_jsonl(f, collection="data")
         out = tmp_path / "exported"
         db.export(out)
@@ -46,7 +46,7 @@ class TestExport:
             '{"metadata": {"role": "user"}}\n'
             '{"metadata": {"role": "assistant"}}\n'
         )
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         db.import_jsonl(f, collection="data")
         out = tmp_path / "exported"
         db.export(out)
@@ -64,7 +64,7 @@ class TestExport:
         f2 = tmp_path / "b.jsonl"
         f2.write_text('{"content": "from b"}\n')
 
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         db.import_jsonl(f1, collection="alpha")
         db.import_jsonl(f2, collection="beta")
         out = tmp_path / "exported"
@@ -85,7 +85,7 @@ class TestExport:
             '{"mimetype": "text/plain", "uri": "https://example.com", "content": "hello", "timestamp": "2024-01-15", "metadata": {"role": "user", "id": 42}}\n'
         )
 
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         db.import_jsonl(original, collection="test")
         out = tmp_path / "exported"
         db.export(out)
@@ -100,11 +100,71 @@ class TestExport:
         assert exported["metadata"]["role"] == "user"
         assert exported["metadata"]["id"] == 42
 
+    def test_exported_lines_match_record_to_json(self, tmp_path):
+        from arkiv.record import parse_jsonl
+
+        original = tmp_path / "original.jsonl"
+        original.write_text(
+            '{"content": "café", "metadata": {"tags": ["a"], "n": {"x": null}}}\n'
+            '{"metadata": {"only": true}}\n'
+            '{"content": "bare"}\n',
+            encoding="utf-8",
+        )
+        db = Database(":memory:")
+        db.import_jsonl(original, collection="test")
+        out = tmp_path / "exported"
+        db.export(out)
+        db.close()
+
+        expected = "".join(r.to_json() + "\n" for r in parse_jsonl(original))
+        assert (out / "test.jsonl").read_text(encoding="utf-8") == expected
+
+    def test_export_reencodes_multiline_metadata(self, tmp_path):
+        """Metadata stored by another writer with newlines stays one line."""
+        db = Database(":memory:")
+        db.conn.execute(
+            "INSERT INTO records (collection, content, metadata) VALUES (?, ?, ?)",
+            ("test", "hi", '{\n  "a": 1\n}'),
+        )
+        db.conn.commit()
+        out = tmp_path / "exported"
+        db.export(out)
+        db.close()
+
+        assert (out / "test.jsonl").read_text() == '{"content":"hi","metadata":{"a":1}}\n'
+
+    def test_export_normalizes_stored_metadata(self, tmp_path):
+        """Metadata written with spaces and escapes is re-encoded compactly."""
+        db = Database(":memory:")
+        db.conn.execute(
+            "INSERT INTO records (collection, content, metadata) VALUES (?, ?, ?)",
+            ("test", "a", '{"a": 1, "n": "\\u00e9"}'),
+        )
+        db.conn.commit()
+        out = tmp_path / "exported"
+        db.export(out)
+        db.close()
+
+        assert (out / "test.jsonl").read_text(encoding="utf-8") == (
+            '{"content":"a","metadata":{"a":1,"n":"é"}}\n'
+        )
+
+    def test_export_rejects_invalid_stored_metadata(self, tmp_path):
+        db = Database(":memory:")
+        db.conn.execute(
+            "INSERT INTO records (collection, content, metadata) VALUES (?, ?, ?)",
+            ("test", "b", '{"a":1} garbage'),
+        )
+        db.conn.commit()
+        with pytest.raises(json.JSONDecodeError):
+            db.export(tmp_path / "exported")
+        db.close()
+
     def test_export_no_manifest_json(self, tmp_path):
         """Export should NOT create manifest.json anymore."""
         f = tmp_path / "input.jsonl"
         f.write_text('{"content": "hello"}\n')
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         db.import_jsonl(f, collection="test")
         out = tmp_path / "exported"
         db.export(out)
@@ -120,7 +180,7 @@ class TestSchemaInReadme:
         """Flat export README body contains a collections summary table."""
         from arkiv.render import BEGIN_SENTINEL, END_SENTINEL
 
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         f = tmp_path / "data.jsonl"
         f.write_text('{"metadata": {"role": "user"}}\n{"metadata": {"role": "admin"}}\n')
         db.import_jsonl(f, collection="data")
@@ -138,7 +198,7 @@ class TestSchemaInReadme:
         from arkiv.render import BEGIN_SENTINEL
         from arkiv.readme import Readme
 
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         f = tmp_path / "data.jsonl"
         f.write_text('{"content": "hi"}\n')
         db.import_jsonl(f, collection="data")
@@ -156,7 +216,7 @@ class TestSchemaInReadme:
 
     def test_export_sets_arkiv_format(self, tmp_path):
         """Exported README has arkiv_format: '0.2' in frontmatter."""
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         f = tmp_path / "data.jsonl"
         f.write_text('{"content": "hi"}\n')
         db.import_jsonl(f, collection="data")
@@ -169,7 +229,7 @@ class TestSchemaInReadme:
 
 class TestTemporalSlicing:
     def _make_db(self, tmp_path):
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         f = tmp_path / "data.jsonl"
         f.write_text(
             '{"timestamp": "2023-06-01", "content": "old"}\n'
@@ -206,7 +266,7 @@ class TestTemporalSlicing:
 
     def test_empty_collection_excluded(self, tmp_path):
         """Collection with zero records after filtering is omitted entirely."""
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         f1 = tmp_path / "old.jsonl"
         f1.write_text('{"timestamp": "2020-01-01", "content": "ancient"}\n')
         f2 = tmp_path / "new.jsonl"
@@ -224,7 +284,7 @@ class TestTemporalSlicing:
 
     def test_until_excludes_future(self, tmp_path):
         """--until 2024 should exclude records from 2025."""
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         f = tmp_path / "data.jsonl"
         f.write_text(
             '{"timestamp": "2024-06-01", "content": "in"}\n'
@@ -246,10 +306,52 @@ class TestTemporalSlicing:
         schema = yaml.safe_load((out / "schema.yaml").read_text())
         assert schema["data"]["record_count"] == 3
 
+    def test_slice_schema_matches_exported_file(self, tmp_path):
+        from arkiv.schema import discover_schema
+
+        db = Database(":memory:")
+        f = tmp_path / "data.jsonl"
+        f.write_text(
+            '{"timestamp": "2023-01-01", "metadata": {"old": 1}}\n'
+            '{"timestamp": "2024-02-01", "metadata": {"role": "user", "n": {"x": 1}}}\n'
+            '{"timestamp": "2024-03-01", "metadata": {"role": "bot"}}\n'
+            '{"timestamp": "2024-04-01", "content": "no metadata"}\n'
+        )
+        db.import_jsonl(f, collection="data")
+        out = tmp_path / "out"
+        db.export(out, since="2024-01-01")
+        db.close()
+        exported = load_schema_yaml(out / "schema.yaml")["data"].metadata_keys
+        assert exported == discover_schema(out / "data.jsonl")
+        assert "old" not in exported
+
+    def test_slice_decodes_metadata_once(self, tmp_path, monkeypatch):
+        from arkiv import jsonio
+
+        db = Database(":memory:")
+        f = tmp_path / "data.jsonl"
+        f.write_text(
+            '{"timestamp": "2024-02-01", "metadata": {"role": "user"}}\n'
+            '{"timestamp": "2024-03-01", "metadata": {"role": "bot"}}\n'
+        )
+        db.import_jsonl(f, collection="data")
+        decoded = []
+        real_loads = jsonio.loads
+
+        def counting_loads(data):
+            decoded.append(data)
+            return real_loads(data)
+
+        monkeypatch.setattr(jsonio, "loads", counting_loads)
+        db.export(tmp_path / "out", since="2024-01-01")
+        db.close()
+        metadata_reads = [d for d in decoded if str(d).startswith('{"role"')]
+        assert sorted(metadata_reads) == ['{"role":"bot"}', '{"role":"user"}']
+
 
 class TestNestedExport:
     def _make_db(self, tmp_path):
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         f1 = tmp_path / "convos.jsonl"
         f1.write_text('{"metadata": {"role": "user"}, "content": "hi"}\n')
         f2 = tmp_path / "books.jsonl"
@@ -344,7 +446,7 @@ class TestNestedExport:
 
     def test_nested_rejects_unsafe_collection_name(self, tmp_path):
         """Even if a bad name somehow reaches the DB, nested export rejects it."""
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         db.conn.execute(
             "INSERT INTO records (collection, content) VALUES (?, ?)",
             ("../evil", "hi"),
@@ -356,7 +458,7 @@ class TestNestedExport:
 
     def test_nested_rejects_dot_prefix_name(self, tmp_path):
         """Even if a bad name somehow reaches the DB, nested export rejects it."""
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         db.conn.execute(
             "INSERT INTO records (collection, content) VALUES (?, ?)",
             (".hidden", "hi"),
@@ -367,7 +469,7 @@ class TestNestedExport:
         db.close()
 
     def test_nested_composable_with_since(self, tmp_path):
-        db = Database(tmp_path / "test.db")
+        db = Database(":memory:")
         f = tmp_path / "data.jsonl"
         f.write_text(
             '{"timestamp": "2023-01-01", "content": "old"}\n'
@@ -0,0 +1,97 @@
+"""Tests for the JSON codec (orjson fast path + stdlib fallback)."""
+
+import json
+
+import pytest
+
+from arkiv import jsonio
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test against both backends."""
+    if request.param == "orjson":
+        if jsonio.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    return request.param
+
+
+class TestLoads:
+    def test_str(self, backend):
+        assert jsonio.loads('{"a": 1}') == {"a": 1}
+
+    def test_bytes(self, backend):
+        assert jsonio.loads('{"name": "café"}'.encode("utf-8")) == {"name": "café"}
+
+    def test_invalid_raises_json_decode_error(self, backend):
+        with pytest.raises(json.JSONDecodeError):
+            jsonio.loads(b"{not json")
+
+    def test_invalid_utf8_raises_unicode_error(self, backend):
+        with pytest.raises(UnicodeDecodeError):
+            jsonio.loads(b'{"a": "\xff"}')
+
+    def test_nan_accepted_like_stdlib(self, backend):
+        value = jsonio.loads('{"x": NaN}')["x"]
+        assert value != value
+
+    def test_big_int_accepted_like_stdlib(self, backend):
+        assert jsonio.loads('{"x": 123456789012345678901234567890}') == {
+            "x": 123456789012345678901234567890
+        }
+
+
+class TestDumps:
+    def test_compact(self, backend):
+        assert jsonio.dumps({"a": 1, "b": [1, 2]}) == '{"a":1,"b":[1,2]}'
+
+    def test_non_ascii_unescaped(self, backend):
+        assert jsonio.dumps({"name": "café"}) == '{"name":"café"}'
+
+    def test_preserves_key_order(self, backend):
+        assert jsonio.dumps({"z": 1, "a": 2}) == '{"z":1,"a":2}'
+
+    def test_non_str_keys_fall_back(self, backend):
+        assert json.loads(jsonio.dumps({1: "x"})) == {"1": "x"}
+
+    def test_big_int_falls_back(self, backend):
+        assert jsonio.dumps({"x": 2**70}) == '{"x":%d}' % 2**70
+
+    def test_floats_round_trip(self, backend):
+        # Exponent spelling differs by backend (1e16 vs 1e+16); the
+        # values read back the same.
+        values = [0.1, 123.456, 1e16, 1e-5, 1.5e300, -2.5e-10]
+        assert json.loads(jsonio.dumps(values)) == values
+        assert jsonio.dumps([0.1, 123.456]) == "[0.1,123.456]"
+
+    def test_non_finite_floats_round_trip(self, backend):
+        obj = {"a": float("nan"), "b": [float("inf"), -float("inf")], "c": None}
+        assert jsonio.dumps(obj) == '{"a":NaN,"b":[Infinity,-Infinity],"c":null}'
+        assert jsonio.dumps_bytes(obj) == jsonio.dumps(obj).encode("utf-8")
+        decoded = jsonio.loads(jsonio.dumps(obj))
+        assert decoded["a"] != decoded["a"]
+        assert decoded["b"] == [float("inf"), -float("inf")]
+        assert decoded["c"] is None
+        assert json.loads(jsonio.dumps_indented(obj))["b"] == decoded["b"]
+
+
+class TestDumpsIndented:
+    def test_matches_stdlib_layout(self, backend):
+        obj = {"a": [1, {"b": None}], "c": {}, "d": [], "e": "café"}
+        assert jsonio.dumps_indented(obj) == json.dumps(
+            obj, indent=2, ensure_ascii=False
+        )
+
+    def test_default_hook(self, backend):
+        assert jsonio.dumps_indented([b"x"], default=str) == '[\n  "b\'x\'"\n]'
+
+    def test_big_int_falls_back(self, backend):
+        assert jsonio.dumps_indented([2**70]) == "[\n  %d\n]" % 2**70
+
+
+class TestDumpsBytes:
+    def test_matches_dumps(self, backend):
+        obj = {"name": "café", "n": [1, 2**70]}
+        assert jsonio.dumps_bytes(obj) == jsonio.dumps(obj).encode("utf-8")
@@ -41,6 +41,23 @@ class TestSplitFrontmatter:
         assert fm == "name: Test"
         assert body == ""
 
+    def test_dashes_inside_a_line_do_not_close(self):
+        text = "---\ntitle: a---b\n---\nBody\n"
+        fm, body = split_frontmatter(text)
+        assert fm == "title: a---b"
+        assert body == "Body\n"
+
+    def test_crlf_and_padded_delimiters(self):
+        text = "---\r\nname: Test\r\n  ---  \r\n\nBody\r\n"
+        fm, body = split_frontmatter(text)
+        assert fm == "name: Test\r"
+        assert body == "Body\r\n"
+
+    def test_empty_frontmatter_block(self):
+        fm, body = split_frontmatter("---\n---\nBody\n")
+        assert fm == ""
+        assert body == "Body\n"
+
 
 class TestReadme:
     def test_default_readme(self):
@@ -34,6 +34,25 @@ class TestReadmeImport:
         assert "b" in info["collections"]
         db.close()
 
+    def test_failed_import_rolls_back_everything(self, tmp_path):
+        (tmp_path / "a.jsonl").write_text('{"content": "from a"}\n')
+        (tmp_path / "b.jsonl").write_bytes(b'{"content": "\xff"}\n')
+        readme = Readme(
+            frontmatter={
+                "name": "Test archive",
+                "contents": [{"path": "a.jsonl"}, {"path": "b.jsonl"}],
+            },
+        )
+        save_readme(readme, tmp_path / "README.md")
+
+        db = Database(tmp_path / "test.db")
+        with pytest.raises(UnicodeDecodeError):
+            db.import_readme(tmp_path / "README.md")
+        assert db.get_info()["total_records"] == 0
+        assert db.get_readme() is None
+        assert db.get_schema() == {}
+        db.close()
+
     def test_import_readme_resolves_relative_paths(self, tmp_path):
         subdir = tmp_path / "data"
         subdir.mkdir()
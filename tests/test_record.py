@@ -1,8 +1,11 @@
 """Tests for arkiv.record."""
 
+import dataclasses
 import json
+import sys
+
 import pytest
-from arkiv.record import Record, parse_record, parse_jsonl
+from arkiv.record import Record, parse_record, parse_jsonl, iter_jsonl_metadata
 
 
 class TestRecord:
@@ -28,6 +31,14 @@ class TestRecord:
         assert r.timestamp is None
         assert r.metadata is None
 
+    def test_to_dict_follows_field_order(self):
+        r = Record(metadata={}, timestamp="t", content="c", uri="u", mimetype="m")
+        assert list(r.to_dict()) == [f.name for f in dataclasses.fields(Record)]
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots")
+    def test_no_instance_dict(self):
+        assert not hasattr(Record(), "__dict__")
+
     def test_content_only(self):
         r = Record(content="Trust the future.")
         assert r.content == "Trust the future."
@@ -61,6 +72,10 @@ class TestRecord:
         parsed = json.loads(line)
         assert parsed == {"content": "hello"}
 
+    def test_to_json_is_compact_utf8(self):
+        r = Record(content="café", metadata={"a": 1})
+        assert r.to_json() == '{"content":"café","metadata":{"a":1}}'
+
     def test_empty_record_to_dict(self):
         r = Record()
         assert r.to_dict() == {}
@@ -91,6 +106,12 @@ class TestParseRecord:
         assert r.metadata["custom_field"] == "value"
         assert r.metadata["another"] == 42
 
+    def test_unknown_fields_do_not_modify_input_metadata(self):
+        data = {"metadata": {"role": "user"}, "extra": 1}
+        r = parse_record(data)
+        assert r.metadata == {"role": "user", "extra": 1}
+        assert data["metadata"] == {"role": "user"}
+
     def test_parse_json_string(self):
         line = '{"content": "hello", "mimetype": "text/plain"}'
         r = parse_record(json.loads(line))
@@ -121,3 +142,27 @@ class TestParseJsonl:
         f.write_text('{"content": "one"}\nnot json\n{"content": "two"}\n')
         records = list(parse_jsonl(f))
         assert len(records) == 2
+
+
+class TestIterJsonlMetadata:
+    def test_matches_parse_jsonl(self, tmp_path):
+        f = tmp_path / "test.jsonl"
+        f.write_text(
+            '{"content": "plain"}\n'
+            '{"metadata": {"a": 1}}\n'
+            '{"metadata": {}}\n'
+            '{"metadata": {"a": 1}, "extra": 2}\n'
+            '{"source": "x"}\n'
+            "not json\n"
+            "[1, 2]\n"
+        )
+        assert list(iter_jsonl_metadata(f)) == [
+            r.metadata for r in parse_jsonl(f)
+        ]
+        assert list(iter_jsonl_metadata(f)) == [
+            None,
+            {"a": 1},
+            None,
+            {"a": 1, "extra": 2},
+            {"source": "x"},
+        ]
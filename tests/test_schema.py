@@ -1,9 +1,15 @@
 """Tests for arkiv.schema."""
 
 import json
+import sys
+
 import pytest
 from arkiv.schema import (
+    MAX_ENUM_VALUES,
     discover_schema,
+    discover_collection_schema,
+    SchemaAccumulator,
+    discover_schema_from_metadata,
     SchemaEntry,
     CollectionSchema,
     load_schema_yaml,
@@ -79,6 +85,43 @@ class TestDiscoverSchema:
         assert d["values"] == ["user"]
 
 
+class TestSchemaAccumulator:
+    def test_matches_batch_discovery(self, tmp_path):
+        mds = [{"role": "user", "n": 1}, None, {}, {"role": "bot", "x": {"y": [1]}}]
+        acc = SchemaAccumulator()
+        for md in mds:
+            acc.update(md)
+        assert acc.finalize() == discover_schema_from_metadata(mds)
+        assert acc.finalize()["x.y"].type == "array"
+
+    def test_empty(self):
+        assert SchemaAccumulator().finalize() == {}
+
+    def test_enum_boundary(self):
+        acc = SchemaAccumulator()
+        for i in range(MAX_ENUM_VALUES):
+            acc.update({"k": f"v{i}", "j": f"v{i}"})
+        acc.update({"j": "extra"})
+        schema = acc.finalize()
+        assert len(schema["k"].values) == MAX_ENUM_VALUES
+        assert schema["j"].values is None
+        assert schema["j"].example == "v0"
+
+    def test_types_of_subclasses(self):
+        from collections import OrderedDict
+
+        class Flag(int):
+            pass
+
+        acc = SchemaAccumulator()
+        acc.update({"b": True, "n": None, "f": Flag(1), "o": OrderedDict(a=1)})
+        schema = acc.finalize()
+        assert schema["b"].type == "boolean"
+        assert schema["n"].type == "null"
+        assert schema["f"].type == "number"
+        assert schema["o.a"].type == "number"
+
+
 class TestDottedSchemaPaths:
     """Nested metadata objects are flattened into dotted keys in schema."""
 
@@ -155,6 +198,13 @@ class TestSchemaEntryDescription:
         e = SchemaEntry(type="string", count=1)
         assert e.description is None
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots")
+    def test_description_assignable_with_slots(self):
+        e = SchemaEntry(type="string", count=1)
+        e.description = "Speaker identity"
+        assert e.to_dict()["description"] == "Speaker identity"
+        assert not hasattr(e, "__dict__")
+
     def test_description_in_to_dict(self):
         e = SchemaEntry(type="string", count=1, description="Speaker identity")
         d = e.to_dict()
@@ -182,6 +232,17 @@ class TestCollectionSchema:
         assert cs.record_count == 100
         assert cs.metadata_keys["role"].count == 100
 
+    def test_discover_collection_schema(self, tmp_path):
+        f = tmp_path / "test.jsonl"
+        f.write_text(
+            '{"content": "a", "metadata": {"role": "user"}}\n'
+            '{"content": "b"}\n'
+            '{"content": "c", "metadata": {"role": "assistant"}}\n'
+        )
+        cs = discover_collection_schema(f)
+        assert cs.record_count == 3
+        assert cs.metadata_keys == discover_schema(f)
+
 
 class TestSchemaYamlIO:
     def test_save_and_load_roundtrip(self, tmp_path):
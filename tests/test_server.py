@@ -55,6 +55,28 @@ class TestArkivServer:
         assert "metadata_keys" in result
         assert "role" in result["metadata_keys"]
 
+    def test_get_schema_is_cached(self, server, monkeypatch):
+        calls = []
+        real = server.db._read_schema
+        monkeypatch.setattr(
+            server.db, "_read_schema", lambda c: calls.append(c) or real(c)
+        )
+        server.get_schema("test")
+        server.get_schema("test")
+        server.get_manifest()
+        server.get_manifest()
+        assert calls == ["test", None]
+
+    def test_schema_cache_sees_other_writers(self, server, tmp_path):
+        from arkiv.database import Database
+
+        assert "lang" not in server.get_schema("test")["metadata_keys"]
+        other = tmp_path / "other.jsonl"
+        other.write_text('{"content": "x", "metadata": {"lang": "en"}}\n')
+        with Database(tmp_path / "test.db") as db:
+            db.import_jsonl(other, collection="test")
+        assert "lang" in server.get_schema("test")["metadata_keys"]
+
     def test_get_schema_all(self, server):
         result = server.get_schema()
         assert "test" in result
@@ -111,6 +133,24 @@ class TestWritableServer:
         assert len(rows) == 1
         srv.close()
 
+    def test_server_reuses_given_database(self, tmp_path):
+        from arkiv.database import Database
+
+        with Database(tmp_path / "test.db") as db:
+            db.insert_record("test", "hello")
+            srv = ArkivServer(db_path=db.path, db=db)
+            assert srv.db is db
+            assert srv.sql_query("SELECT content FROM records")[0]["content"] == "hello"
+
+    def test_manifest_cache_tracks_own_writes(self, tmp_path):
+        srv = ArkivServer(db_path=tmp_path / "test.db", writable=True)
+        srv.db.insert_record("test", "one")
+        first = srv.get_manifest()
+        assert srv.get_manifest() is first
+        srv.db.insert_record("test", "two")
+        assert srv.get_manifest()["collections"][0]["record_count"] == 2
+        srv.close()
+
     def test_readonly_server_cannot_write(self, tmp_path):
         """ArkivServer without writable flag opens DB read-only."""
         # Create DB first so it exists for read-only open
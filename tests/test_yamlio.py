@@ -0,0 +1,48 @@
+"""Tests for the YAML helpers (libyaml loader, pure-Python dumper)."""
+
+import pytest
+import yaml
+
+from arkiv import yamlio
+
+
+class TestSafeLoad:
+    def test_block_mapping(self):
+        assert yamlio.safe_load("name: x\nitems:\n- 1\n- 2\n") == {
+            "name": "x",
+            "items": [1, 2],
+        }
+
+    def test_json_object(self):
+        assert yamlio.safe_load('  {"name": "café", "n": [1, 2]}') == {
+            "name": "café",
+            "n": [1, 2],
+        }
+
+    def test_json_looking_documents_keep_yaml_semantics(self):
+        # YAML 1.1 needs a dot for floats and has no bare NaN, so these
+        # stay strings, whatever a JSON parser would make of them.
+        assert yamlio.safe_load('{"a": 1e5, "b": NaN}') == {"a": "1e5", "b": "NaN"}
+
+    def test_flow_mapping_that_is_not_json(self):
+        assert yamlio.safe_load("{name: x, n: 1}") == {"name": "x", "n": 1}
+
+    def test_empty(self):
+        assert yamlio.safe_load("") is None
+
+    def test_rejects_python_tags(self):
+        with pytest.raises(yaml.YAMLError):
+            yamlio.safe_load("!!python/object/apply:os.getcwd []")
+
+
+class TestDump:
+    def test_matches_yaml_dump_layout(self):
+        data = {"z": 1, "a": {"b": [1, "two"]}, "s": "yes"}
+        assert yamlio.dump(data) == "z: 1\na:\n  b:\n  - 1\n  - two\ns: 'yes'\n"
+
+    def test_keeps_astral_characters_unescaped(self):
+        assert yamlio.dump({"name": "café 😀"}) == "name: café 😀\n"
+
+    def test_roundtrip(self):
+        data = {"name": "x", "contents": [{"path": "a.jsonl"}], "n": None}
+        assert yamlio.safe_load(yamlio.dump(data)) == data